@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import argparse
+import os
 import sys
 from pathlib import Path
 
@@ -16,7 +17,8 @@ from psypyenv.requirements import parse_requirements
 def _collect_samples(directory: Path) -> list[Path]:
     if not directory.exists():
         raise FileNotFoundError(f"Sample directory does not exist: {directory}")
-    return sorted(path for path in directory.glob("*.txt") if path.is_file())
+    with os.scandir(directory) as entries:
+        return sorted(Path(entry.path) for entry in entries if entry.name.endswith(".txt") and entry.is_file())
 
 
 def main() -> int:
@@ -1,23 +1,27 @@
 from __future__ import annotations
 
-from .cli import main as main
-from .environment import (
-    find_conda_executable,
-    get_installed_packages,
-    get_python_version,
-    infer_python_version,
-    inspect_environment,
-    list_conda_environments,
-    resolve_python_executable,
-)
-from .models import EnvironmentReport, PackageRequirement, RequirementSpec
-from .reporting import format_reports, reports_to_json
-from .requirements import (
-    parse_requirement_line,
-    parse_requirements,
-    parse_requirement_text,
-    parse_single_requirement,
-)
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
+
+if TYPE_CHECKING:
+    from .cli import main as main
+    from .environment import (
+        find_conda_executable,
+        get_installed_packages,
+        get_python_version,
+        infer_python_version,
+        inspect_environment,
+        list_conda_environments,
+        resolve_python_executable,
+    )
+    from .models import EnvironmentReport, PackageRequirement, RequirementSpec
+    from .reporting import format_reports, reports_to_json
+    from .requirements import (
+        parse_requirement_line,
+        parse_requirements,
+        parse_requirement_text,
+        parse_single_requirement,
+    )
 
 __all__ = [
     "EnvironmentReport",
@@ -38,3 +42,39 @@ __all__ = [
     "reports_to_json",
     "main",
 ]
+
+# Public name -> (submodule, attribute). Submodules are imported on first
+# access so that ``import psypyenv`` stays cheap.
+_LAZY_ATTRIBUTES: Dict[str, Tuple[str, str]] = {
+    "EnvironmentReport": ("models", "EnvironmentReport"),
+    "PackageRequirement": ("models", "PackageRequirement"),
+    "RequirementSpec": ("models", "RequirementSpec"),
+    "find_conda_executable": ("environment", "find_conda_executable"),
+    "get_installed_packages": ("environment", "get_installed_packages"),
+    "get_python_version": ("environment", "get_python_version"),
+    "infer_python_version": ("environment", "infer_python_version"),
+    "inspect_environment": ("environment", "inspect_environment"),
+    "list_conda_environments": ("environment", "list_conda_environments"),
+    "resolve_python_executable": ("environment", "resolve_python_executable"),
+    "parse_requirements": ("requirements", "parse_requirements"),
+    "parse_requirement_line": ("requirements", "parse_requirement_line"),
+    "parse_requirement_text": ("requirements", "parse_requirement_text"),
+    "parse_single_requirement": ("requirements", "parse_single_requirement"),
+    "format_reports": ("reporting", "format_reports"),
+    "reports_to_json": ("reporting", "reports_to_json"),
+    "main": ("cli", "main"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name, attribute = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(f".{module_name}", __name__), attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+import json
+from typing import Any, Callable, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speed-up
+    orjson = None
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can
+    # keep catching the standard library exception.
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(data: Any, *, indent: bool = False, default: Optional[Callable[[Any], Any]] = None) -> str:
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(data, default=default, option=option).decode("utf-8")
+    # Match orjson's output: raw UTF-8 and no spaces in compact mode.
+    if indent:
+        return json.dumps(data, indent=2, default=default, ensure_ascii=False)
+    return json.dumps(data, separators=(",", ":"), default=default, ensure_ascii=False)
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import pickle
+from pathlib import Path
+from typing import Any, Optional
+
+from platformdirs import user_cache_path
+
+from .config import APP_NAME
+
+
+LOGGER = logging.getLogger(__name__)
+
+# Bump whenever the shape of cached objects changes so old entries are ignored.
+CACHE_FORMAT_VERSION = 1
+
+
+def cache_key(*parts: object) -> str:
+    raw = repr((CACHE_FORMAT_VERSION,) + parts).encode("utf-8")
+    return hashlib.blake2b(raw, digest_size=8).hexdigest()
+
+
+def load_cached_object(namespace: str, key: str) -> Optional[Any]:
+    path = _cache_root() / namespace / f"{key}.pkl"
+    try:
+        data = path.read_bytes()
+    except OSError:
+        return None
+    try:
+        return pickle.loads(data)
+    except Exception as exc:  # a truncated or foreign file is just a miss
+        LOGGER.debug("Ignoring unreadable cache entry %s: %s", path, exc)
+        return None
+
+
+def store_cached_object(namespace: str, key: str, value: Any) -> None:
+    directory = _cache_root() / namespace
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+        (directory / f"{key}.pkl").write_bytes(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+    except OSError as exc:
+        LOGGER.debug("Could not write cache entry in %s: %s", directory, exc)
+
+
+def _cache_root() -> Path:
+    return Path(user_cache_path(APP_NAME))
@@ -1,23 +1,49 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import logging
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Optional, Sequence, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
 
-from .config import add_cached_conda_env, load_cached_conda_envs, save_cached_conda_envs
+from .config import (
+    add_cached_conda_env,
+    cached_conda_envs_expired,
+    cached_envs_ttl,
+    load_cached_conda_env_mtimes,
+    load_cached_conda_envs,
+    load_cached_conda_envs_saved_at,
+    save_cached_conda_envs,
+)
 from .environment import (
+    conda_meta_mtime,
     find_conda_executable,
     infer_python_version,
     inspect_environment,
     list_conda_environments,
     resolve_python_executable,
 )
+from .models import EnvironmentReport, PackageRequirement
 from .reporting import format_reports, reports_to_json
 from .requirements import parse_requirements
 
 
+_LOG_LEVELS = {
+    "CRITICAL": logging.CRITICAL,
+    "FATAL": logging.FATAL,
+    "ERROR": logging.ERROR,
+    "WARNING": logging.WARNING,
+    "WARN": logging.WARN,
+    "INFO": logging.INFO,
+    "DEBUG": logging.DEBUG,
+    "NOTSET": logging.NOTSET,
+}
+_logging_configured = False
+
+
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="Inspect Python environments and verify requirement compatibility.",
@@ -69,6 +95,12 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Display absolute interpreter paths in the text output.",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        help="Maximum number of environments to inspect in parallel (default: up to 8).",
+    )
     parser.add_argument(
         "--log-level",
         default="WARNING",
@@ -82,6 +114,9 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
     args = parser.parse_args(argv)
     _configure_logging(args.log_level)
 
+    if args.jobs is not None and args.jobs < 1:
+        parser.error("--jobs must be at least 1.")
+
     requirements_path = args.requirements
     if not requirements_path.exists():
         parser.error(f"Requirements file not found: {requirements_path}")
@@ -120,25 +155,66 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
     if not targets:
         parser.error("No Python environments to inspect.")
 
-    reports = [
-        inspect_environment(name, path, requirements)
-        for name, path in targets
-    ]
+    reports = _inspect_targets(targets, requirements, max_workers=args.jobs)
 
     if args.json:
-        print(reports_to_json(reports))
+        output = reports_to_json(reports)
     else:
-        text = format_reports(reports, recommended_python, include_paths=args.show_paths)
+        parts = [format_reports(reports, recommended_python, include_paths=args.show_paths)]
         if extra_indexes:
-            text += "\n\nExtra package indexes:\n" + "\n".join(extra_indexes)
-        print(text)
+            parts.append("\nExtra package indexes:")
+            parts.extend(extra_indexes)
+        output = "\n".join(parts)
+    sys.stdout.write(output + "\n")
+    sys.stdout.flush()
 
     return 0
 
 
+def _inspect_targets(
+    targets: Sequence[Tuple[str, Path]],
+    requirements: Sequence[PackageRequirement],
+    max_workers: Optional[int] = None,
+) -> List[EnvironmentReport]:
+    total = len(targets)
+    workers = min(max_workers or 8, total)
+    if workers <= 1:
+        reports = []
+        for index, (name, path) in enumerate(targets, start=1):
+            reports.append(inspect_environment(name, path, requirements))
+            logging.log(_progress_level(index, total), "Inspected environment %s/%s: %s", index, total, name)
+        return reports
+    # Each inspection mostly waits on interpreter subprocesses, so a thread
+    # pool overlaps them. Results are slotted back by index so the report
+    # order still follows the targets, whatever order they finish in.
+    results: List[Optional[EnvironmentReport]] = [None] * total
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(inspect_environment, name, path, requirements): index
+            for index, (name, path) in enumerate(targets)
+        }
+        for done, future in enumerate(as_completed(futures), start=1):
+            index = futures[future]
+            results[index] = future.result()
+            logging.log(
+                _progress_level(done, total),
+                "Inspected environment %s/%s: %s",
+                done,
+                total,
+                targets[index][0],
+            )
+    return [report for report in results if report is not None]
+
+
 def _configure_logging(level: str) -> None:
-    numeric_level = getattr(logging, level.upper(), logging.WARNING)
-    logging.basicConfig(level=numeric_level, format="%(levelname)s: %(message)s")
+    global _logging_configured
+    numeric_level = _LOG_LEVELS.get(level.upper(), logging.WARNING)
+    if not _logging_configured:
+        logging.basicConfig(level=numeric_level, format="%(levelname)s: %(message)s")
+        _logging_configured = True
+    # basicConfig ignores later calls, so apply the level explicitly for
+    # repeated main() invocations in the same process.
+    logging.getLogger().setLevel(numeric_level)
 
 
 def _collect_targets(
@@ -150,44 +226,49 @@ def _collect_targets(
     preloaded_cached_envs: Optional[Sequence[Tuple[str, str]]] = None,
 ) -> List[Tuple[str, Path]]:
     targets: List[Tuple[str, Path]] = []
-    seen: set[Path] = set()
+    seen: set[str] = set()
 
-    def add_target(name: str, path: Path) -> None:
-        resolved = path.resolve()
-        if resolved in seen:
-            return
-        seen.add(resolved)
-        targets.append((name, resolved))
-
-    add_target("current", Path(sys.executable))
+    _add_target(targets, seen, "current", _current_python(), resolved=True)
 
     if explicit_pythons:
         for index, item in enumerate(explicit_pythons, start=1):
-            candidate = Path(item)
-            if not candidate.exists():
-                logging.warning("Python interpreter not found: %s", candidate)
+            if not os.path.isfile(item):
+                logging.warning("Python interpreter not found: %s", item)
                 continue
-            add_target(f"python-{index}", candidate)
+            _add_target(targets, seen, f"python-{index}", Path(item))
 
     if include_conda:
         cached_entries: List[Tuple[str, str]]
+        cached_mtimes: Dict[str, int] = {}
+        cached_saved_at: Optional[int] = None
+        expired = False
         if refresh_cache:
             logging.info("Refreshing cached conda environments before scanning.")
             cached_entries = []
         else:
-            cached_entries = load_cached_conda_envs()
+            # An expired list still supplies targets and is merged into the
+            # rescan, so interpreters registered by hand are not dropped.
+            cached_entries = load_cached_conda_envs(include_expired=True)
+            cached_mtimes = load_cached_conda_env_mtimes(include_expired=True)
+            cached_saved_at = load_cached_conda_envs_saved_at()
+            expired = cached_conda_envs_expired()
+            if expired:
+                logging.info("Cached conda environments are older than %ss; rescanning.", cached_envs_ttl())
+        # Entries registered on this command line are persisted before we get
+        # here, so they do not count as a warm cache.
+        registered = set(preloaded_cached_envs or ())
+        stored_entries = {entry for entry in cached_entries if entry not in registered}
         cached_records: List[Tuple[str, str]] = []
-        seen_cached_paths: set[Path] = set()
-
-        def record_cache(env_name: str, python_path: Path) -> None:
-            try:
-                resolved_python = python_path.resolve()
-            except FileNotFoundError:
-                return
-            if resolved_python in seen_cached_paths:
-                return
-            seen_cached_paths.add(resolved_python)
-            cached_records.append((env_name, str(resolved_python)))
+        record_mtimes: Dict[str, Optional[int]] = {}
+
+        def record_cache(env_name: str, python_path: Path) -> Optional[int]:
+            resolved_python = os.path.realpath(python_path)
+            if resolved_python in record_mtimes:
+                return record_mtimes[resolved_python]
+            mtime = conda_meta_mtime(Path(resolved_python))
+            record_mtimes[resolved_python] = mtime
+            cached_records.append((env_name, resolved_python))
+            return mtime
 
         if preloaded_cached_envs:
             cached_entries.extend(preloaded_cached_envs)
@@ -198,23 +279,40 @@ def _collect_targets(
                 len(cached_entries),
                 "" if len(cached_entries) == 1 else "s",
             )
+        reused_stored_entry = False
+        stale_entry = False
         for index, (cached_name, cached_path) in enumerate(cached_entries, start=1):
             python_path = Path(cached_path)
             if not python_path.exists():
                 continue
-            logging.info(
+            logging.log(
+                _progress_level(index, len(cached_entries)),
                 "Cached conda environment %s/%s: %s",
                 index,
                 len(cached_entries),
                 python_path,
             )
-            add_target(cached_name, python_path)
-            record_cache(cached_name, python_path)
+            _add_target(targets, seen, cached_name, python_path)
+            mtime = record_cache(cached_name, python_path)
+            if (cached_name, cached_path) in stored_entries:
+                reused_stored_entry = True
+                recorded_mtime = cached_mtimes.get(cached_path)
+                if recorded_mtime is not None and recorded_mtime != mtime:
+                    logging.info("Cached conda environment %s changed since it was cached.", cached_name)
+                    stale_entry = True
+
+        if reused_stored_entry and not stale_entry and not expired:
+            # A warm cache answers the question conda env list would; only
+            # an explicit refresh pays for locating and running conda again.
+            logging.info("Skipping conda discovery; pass --refresh-conda-envs to rescan.")
+            # Only a real conda env list restarts the TTL.
+            save_cached_conda_envs(cached_records, record_mtimes, cached_saved_at)
+            return targets
 
         conda_path = find_conda_executable(conda_candidate)
         if not conda_path:
             logging.warning("Conda executable not found.")
-            save_cached_conda_envs(cached_records)
+            save_cached_conda_envs(cached_records, record_mtimes, cached_saved_at)
             return targets
         environments = list_conda_environments(conda_path)
         total_envs = len(environments)
@@ -229,19 +327,49 @@ def _collect_targets(
             if not python_path:
                 logging.debug("Python executable not found for env %s", env_path)
                 continue
-            logging.info(
+            logging.log(
+                _progress_level(index, total_envs),
                 "Scanning conda environment %s/%s: %s",
                 index,
                 total_envs or 1,
                 env_path,
             )
             name = env_path.name or "base"
-            add_target(name, python_path)
+            _add_target(targets, seen, name, python_path)
             record_cache(name, python_path)
-        save_cached_conda_envs(cached_records)
+        save_cached_conda_envs(cached_records, record_mtimes)
 
     return targets
 
 
+def _progress_level(index: int, total: int) -> int:
+    # Long environment lists only report every tenth of the way at INFO;
+    # the rest of the per-environment lines go to DEBUG.
+    step = max(1, total // 10)
+    if index % step == 0 or index == total:
+        return logging.INFO
+    return logging.DEBUG
+
+
+def _add_target(
+    targets: List[Tuple[str, Path]],
+    seen: set[str],
+    name: str,
+    path: Path,
+    *,
+    resolved: bool = False,
+) -> None:
+    real_path = str(path) if resolved else os.path.realpath(path)
+    if real_path in seen:
+        return
+    seen.add(real_path)
+    targets.append((name, path if resolved else Path(real_path)))
+
+
+@functools.lru_cache(maxsize=1)
+def _current_python() -> Path:
+    return Path(os.path.realpath(sys.executable))
+
+
 if __name__ == "__main__":
     sys.exit(main())
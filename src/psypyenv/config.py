@@ -1,28 +1,57 @@
 from __future__ import annotations
 
 import configparser
+import functools
+import io
+import logging
 import os
-import json
+import re
+import stat
+import tempfile
+import time
 from pathlib import Path
-from typing import Iterable, List, Optional, Sequence, Tuple
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
 
 from platformdirs import user_config_path
 
+from . import _jsonlib
+
+
+LOGGER = logging.getLogger(__name__)
 
 APP_NAME = "psypyenv"
 CONFIG_SECTION = "conda"
 CONFIG_KEY = "path"
 CONFIG_EXTRA_PATHS_KEY = "extra_paths"
 CONFIG_CACHED_ENVS_KEY = "cached_envs"
+# Tag stored alongside cached_envs; older releases wrote a bare list.
+CACHED_ENVS_FORMAT = 1
+
+# Seconds a cached conda environment list is trusted before a rescan.
+DEFAULT_CACHE_TTL = 3600
+CACHE_TTL_ENV_VAR = "PSYPYENV_CACHE_TTL"
+
+# Per-entry st_mtime_ns of the environment's conda-meta directory.
+CACHED_ENV_MTIME_FIELD = "conda_meta_mtime"
 
+# Entries written by save_cached_conda_envs always list "name" before "path".
+_CACHED_ENV_ENTRY_RE = re.compile(
+    r'\{\s*"name"\s*:\s*"(?P<name>(?:[^"\\]|\\.)*)"\s*,'
+    r'\s*"path"\s*:\s*"(?P<path>(?:[^"\\]|\\.)*)"\s*[,}]'
+)
+# saved_at is written before the entries, so the first match is the payload's.
+_CACHED_ENVS_SAVED_AT_RE = re.compile(r'"saved_at"\s*:\s*(\d+)')
 
+
+@functools.lru_cache(maxsize=1)
 def _config_file() -> Path:
-    directory = Path(user_config_path(APP_NAME, ensure_exists=True))
-    directory.mkdir(parents=True, exist_ok=True)
-    return directory / "settings.ini"
+    # ensure_exists already creates the directory.
+    return Path(user_config_path(APP_NAME, ensure_exists=True)) / "settings.ini"
 
 
 def save_conda_path(conda_path: str) -> None:
+    if load_conda_path() == conda_path:
+        return
     config = _load_or_create()
     config[CONFIG_SECTION][CONFIG_KEY] = conda_path
     _write_config(config)
@@ -32,8 +61,7 @@ def load_conda_path() -> Optional[str]:
     config = _read_config()
     if config is None or CONFIG_SECTION not in config:
         return None
-    section = config[CONFIG_SECTION]
-    return section.get(CONFIG_KEY)
+    return config[CONFIG_SECTION].get(CONFIG_KEY)
 
 
 def load_conda_search_paths() -> List[str]:
@@ -73,17 +101,24 @@ def add_conda_search_path(path: str) -> None:
     save_conda_search_paths(current)
 
 
-def load_cached_conda_envs() -> List[Tuple[str, str]]:
-    config = _read_config()
-    if config is None or CONFIG_SECTION not in config:
-        return []
-    section = config[CONFIG_SECTION]
-    raw_value = section.get(CONFIG_CACHED_ENVS_KEY)
+def load_cached_conda_envs(include_expired: bool = False) -> List[Tuple[str, str]]:
+    raw_value = _cached_envs_raw()
     if not raw_value:
         return []
     try:
-        payload = json.loads(raw_value)
-    except json.JSONDecodeError:
+        payload = _jsonlib.loads(raw_value)
+    except ValueError:
+        return []
+    if isinstance(payload, dict) and payload.get("_v") == CACHED_ENVS_FORMAT:
+        if not include_expired and _cached_envs_expired(payload.get("saved_at")):
+            return []
+        # Written by save_cached_conda_envs, which already stripped and
+        # de-duplicated every entry.
+        try:
+            return [(item["name"], item["path"]) for item in payload["envs"]]
+        except (KeyError, TypeError):
+            return []
+    if not isinstance(payload, list):
         return []
     environments: List[Tuple[str, str]] = []
     for item in payload:
@@ -103,7 +138,39 @@ def load_cached_conda_envs() -> List[Tuple[str, str]]:
     return environments
 
 
-def save_cached_conda_envs(items: Sequence[Tuple[str, str]]) -> None:
+def load_cached_conda_env_mtimes(include_expired: bool = False) -> Dict[str, int]:
+    raw_value = _cached_envs_raw()
+    if not raw_value or not _is_tagged_cached_envs(raw_value):
+        return {}
+    if not include_expired and _raw_cached_envs_expired(raw_value):
+        return {}
+    try:
+        payload = _jsonlib.loads(raw_value)
+        return {
+            item["path"]: item[CACHED_ENV_MTIME_FIELD]
+            for item in payload["envs"]
+            if isinstance(item.get(CACHED_ENV_MTIME_FIELD), int)
+        }
+    except (ValueError, KeyError, TypeError, AttributeError):
+        return {}
+
+
+def load_cached_conda_envs_saved_at() -> Optional[int]:
+    raw_value = _cached_envs_raw()
+    if not raw_value or not _is_tagged_cached_envs(raw_value):
+        return None
+    try:
+        saved_at = _jsonlib.loads(raw_value).get("saved_at")
+    except (ValueError, AttributeError):
+        return None
+    return saved_at if isinstance(saved_at, int) else None
+
+
+def save_cached_conda_envs(
+    items: Sequence[Tuple[str, str]],
+    mtimes: Optional[Mapping[str, Optional[int]]] = None,
+    saved_at: Optional[int] = None,
+) -> None:
     normalised: List[dict] = []
     seen: set[Tuple[str, str]] = set()
     for name, path in items:
@@ -115,44 +182,181 @@ def save_cached_conda_envs(items: Sequence[Tuple[str, str]]) -> None:
         if key in seen:
             continue
         seen.add(key)
-        normalised.append({"name": clean_name, "path": clean_path})
+        entry: Dict[str, object] = {"name": clean_name, "path": clean_path}
+        mtime = mtimes.get(clean_path) if mtimes else None
+        if mtime is not None:
+            entry[CACHED_ENV_MTIME_FIELD] = mtime
+        normalised.append(entry)
     config = _load_or_create()
     if normalised:
-        config[CONFIG_SECTION][CONFIG_CACHED_ENVS_KEY] = json.dumps(normalised)
+        config[CONFIG_SECTION][CONFIG_CACHED_ENVS_KEY] = _jsonlib.dumps(
+            {
+                "_v": CACHED_ENVS_FORMAT,
+                "saved_at": int(time.time()) if saved_at is None else saved_at,
+                "envs": normalised,
+            }
+        )
     elif CONFIG_CACHED_ENVS_KEY in config[CONFIG_SECTION]:
         del config[CONFIG_SECTION][CONFIG_CACHED_ENVS_KEY]
     _write_config(config)
 
 
+def iter_cached_conda_env_names() -> Iterator[str]:
+    raw_value = _cached_envs_raw()
+    if not raw_value:
+        return
+    if not _is_tagged_cached_envs(raw_value):
+        for name, _ in load_cached_conda_envs():
+            yield name
+        return
+    if _raw_cached_envs_expired(raw_value):
+        return
+    for match in _CACHED_ENV_ENTRY_RE.finditer(raw_value):
+        yield _json_string(match.group("name"))
+
+
+def lookup_cached_conda_env(name: str) -> Optional[str]:
+    raw_value = _cached_envs_raw()
+    if not raw_value:
+        return None
+    wanted = str(name).strip()
+    if not _is_tagged_cached_envs(raw_value):
+        return next((path for env_name, path in load_cached_conda_envs() if env_name == wanted), None)
+    if _raw_cached_envs_expired(raw_value):
+        return None
+    for match in _CACHED_ENV_ENTRY_RE.finditer(raw_value):
+        if _json_string(match.group("name")) == wanted:
+            return _json_string(match.group("path"))
+    return None
+
+
 def add_cached_conda_env(name: str, path: str) -> None:
-    current = load_cached_conda_envs()
     entry = (str(name).strip(), str(path).strip())
     if not entry[0] or not entry[1]:
         return
+    if lookup_cached_conda_env(entry[0]) == entry[1]:
+        return
+    # Expired entries are kept; the next conda scan merges them into its result.
+    current = load_cached_conda_envs(include_expired=True)
     if entry not in current:
         current.append(entry)
-        save_cached_conda_envs(current)
+        # Registering an interpreter is not a rescan, so a live list keeps its
+        # age; an empty or expired one starts a new TTL with this entry.
+        saved_at = None if cached_conda_envs_expired() else load_cached_conda_envs_saved_at()
+        save_cached_conda_envs(current, load_cached_conda_env_mtimes(include_expired=True), saved_at)
 
 
-def _load_or_create() -> configparser.ConfigParser:
+def cached_envs_ttl() -> int:
+    raw_value = os.environ.get(CACHE_TTL_ENV_VAR)
+    if raw_value:
+        try:
+            return int(raw_value)
+        except ValueError:
+            LOGGER.warning("Ignoring invalid %s=%r", CACHE_TTL_ENV_VAR, raw_value)
+    return DEFAULT_CACHE_TTL
+
+
+def cached_conda_envs_expired() -> bool:
+    raw_value = _cached_envs_raw()
+    if not raw_value or not _is_tagged_cached_envs(raw_value):
+        return False
+    return _raw_cached_envs_expired(raw_value)
+
+
+def _raw_cached_envs_expired(raw_value: str) -> bool:
+    match = _CACHED_ENVS_SAVED_AT_RE.search(raw_value)
+    return match is not None and _cached_envs_expired(int(match.group(1)))
+
+
+def _cached_envs_expired(saved_at: object) -> bool:
+    # Payloads from before timestamps were recorded are treated as fresh.
+    if not isinstance(saved_at, (int, float)):
+        return False
+    return time.time() - saved_at > cached_envs_ttl()
+
+
+def _cached_envs_raw() -> Optional[str]:
     config = _read_config()
-    if config is None:
-        config = configparser.ConfigParser()
+    if config is None or CONFIG_SECTION not in config:
+        return None
+    return config[CONFIG_SECTION].get(CONFIG_CACHED_ENVS_KEY)
+
+
+def _is_tagged_cached_envs(raw_value: str) -> bool:
+    # Legacy payloads are bare JSON lists; tagged ones are objects.
+    return raw_value.lstrip().startswith("{")
+
+
+def _json_string(body: str) -> str:
+    if "\\" not in body:
+        return body
+    return _jsonlib.loads(f'"{body}"')
+
+
+def _load_or_create() -> configparser.ConfigParser:
+    config = configparser.ConfigParser()
+    cached = _read_config()
+    if cached is not None:
+        # The parsed config is shared between readers; callers of this
+        # function mutate it, so they get their own copy.
+        config.read_dict({section: dict(cached.items(section, raw=True)) for section in cached.sections()})
     if CONFIG_SECTION not in config:
         config[CONFIG_SECTION] = {}
     return config
 
 
+# settings.ini path -> (mtime_ns, size, parsed config). Entries are replaced
+# whenever the file changes on disk or is rewritten through _write_config.
+_parsed_configs: Dict[Path, Tuple[int, int, configparser.ConfigParser]] = {}
+
+
 def _read_config() -> Optional[configparser.ConfigParser]:
     file_path = _config_file()
-    if not file_path.exists():
+    try:
+        file_stat = file_path.stat()
+    except OSError:
+        _parsed_configs.pop(file_path, None)
         return None
+    cached = _parsed_configs.get(file_path)
+    if cached is not None and cached[:2] == (file_stat.st_mtime_ns, file_stat.st_size):
+        return cached[2]
     config = configparser.ConfigParser()
-    config.read(file_path)
+    try:
+        with file_path.open(encoding="utf-8") as handle:
+            config.read_file(handle)
+    except OSError:
+        return None
+    _parsed_configs[file_path] = (file_stat.st_mtime_ns, file_stat.st_size, config)
     return config
 
 
 def _write_config(config: configparser.ConfigParser) -> None:
     file_path = _config_file()
-    with file_path.open("w", encoding="utf-8") as handle:
-        config.write(handle)
+    buffer = io.StringIO()
+    config.write(buffer)
+    # Replace the file the settings path points at, so a symlinked
+    # settings.ini stays a symlink.
+    target = Path(os.path.realpath(file_path))
+    try:
+        mode = stat.S_IMODE(target.stat().st_mode)
+    except OSError:
+        # Nothing to swap out yet; a plain write picks up the usual umask.
+        target.write_text(buffer.getvalue(), encoding="utf-8")
+    else:
+        # Write the whole file in one go to a sibling temp file and swap it
+        # in, so readers never see a half-written settings.ini.
+        handle, temp_name = tempfile.mkstemp(prefix=f".{target.name}.", dir=str(target.parent))
+        try:
+            with os.fdopen(handle, "w", encoding="utf-8") as temp_file:
+                temp_file.write(buffer.getvalue())
+            # mkstemp creates the file 0600; keep the permissions it replaces.
+            os.chmod(temp_name, mode)
+            os.replace(temp_name, target)
+        except BaseException:
+            try:
+                os.unlink(temp_name)
+            except OSError:
+                pass
+            raise
+    file_stat = file_path.stat()
+    _parsed_configs[file_path] = (file_stat.st_mtime_ns, file_stat.st_size, config)
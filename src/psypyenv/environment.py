@@ -1,44 +1,243 @@
 from __future__ import annotations
 
+import functools
 import json
 import logging
 import os
 import platform
 import re
+import stat
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Sequence
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
 from packaging.markers import Marker
 from packaging.specifiers import InvalidSpecifier, SpecifierSet
 from packaging.version import InvalidVersion, Version
 
+from . import _jsonlib
+from .cache import cache_key, load_cached_object, store_cached_object
 from .config import load_conda_path, load_conda_search_paths, save_conda_path
 from .models import EnvironmentReport, PackageRequirement, RequirementSpec
 
 
 LOGGER = logging.getLogger(__name__)
 
+_PACKAGES_CACHE_NAMESPACE = "packages"
+_NAME_SEPARATOR_RE = re.compile(r"[-_.]+")
+_METADATA_NAME_RE = re.compile(r"^Name:\s*(\S+)", re.MULTILINE)
+_METADATA_VERSION_RE = re.compile(r"^Version:\s*(\S+)", re.MULTILINE)
+_VERSIONED_PYTHON_RE = re.compile(r"python(\d+\.\d+)")
+_PYTHON_VERSION_OUTPUT_RE = re.compile(r"Python\s*(\d+\.\d+(?:\.\d+)?)")
+_FREEZE_LINE_RE = re.compile(r"^[ \t]*([^=\s]+)[ \t]*==[ \t]*(\S+)", re.MULTILINE)
+_PYVENV_VERSION_RE = re.compile(r"^version(?:_info)?\s*=\s*(\d+\.\d+(?:\.\d+)?)", re.MULTILINE)
+_PYVENV_SYSTEM_SITE_RE = re.compile(r"^include-system-site-packages\s*=\s*(\S+)", re.MULTILINE | re.IGNORECASE)
 
+if sys.platform == "win32":
+    _CONDA_EXECUTABLE_NAMES: Tuple[str, ...] = ("conda.exe", "conda.bat", "conda")
+    _CONDA_SUBDIRECTORIES: Tuple[str, ...] = ("", "Scripts", "condabin")
+    _PYTHON_RELATIVE_PATHS: Tuple[str, ...] = ("python.exe", "Scripts/python.exe")
+else:
+    _CONDA_EXECUTABLE_NAMES = ("conda",)
+    _CONDA_SUBDIRECTORIES = ("", "bin", "condabin")
+    _PYTHON_RELATIVE_PATHS = ("python", "bin/python")
+
+# Directories inside a conda installation that hold the conda entry point.
+_CONDA_INSTALL_DIRECTORIES = frozenset(subdirectory for subdirectory in _CONDA_SUBDIRECTORIES if subdirectory)
+
+# conda packages whose Python distribution is published under another name.
+# Keys and values are stored already normalised.
+_CONDA_TO_PYPI_NAMES: Dict[str, str] = {
+    "matplotlib-base": "matplotlib",
+    "msgpack-python": "msgpack",
+    "pytables": "tables",
+    "pytorch": "torch",
+}
+
+# Candidates for infer_python_version, newest first.
+_CANDIDATE_PYTHON_VERSIONS: Tuple[Tuple[str, Version], ...] = tuple(
+    (version, Version(version + ".0")) for version in ("3.12", "3.11", "3.10", "3.9", "3.8")
+)
+
+# Conda executables located by find_conda_executable, keyed by its inputs
+# (see _conda_lookup_key).
+_CondaLookupKey = Tuple[Optional[str], Optional[str], Tuple[str, ...], Optional[str], Optional[str]]
+_RESOLVED_CONDA: Dict[_CondaLookupKey, Path] = {}
+# Raw PATH value and its split entries, reused while PATH is unchanged.
+_PATH_CACHE: Optional[Tuple[str, Tuple[str, ...]]] = None
+
+
+@functools.lru_cache(maxsize=4096)
 def normalise_name(name: str) -> str:
-    return name.lower().replace("_", "-")
+    # PEP 503: runs of "-", "_" and "." are equivalent, which also lines up
+    # the escaped names used in .dist-info directories.
+    return _NAME_SEPARATOR_RE.sub("-", name).lower()
 
 
 def get_installed_packages(python_executable: Path, timeout: int = 60) -> Dict[str, str]:
+    stamp = _package_directories_stamp(python_executable)
+    if stamp is None:
+        return _collect_installed_packages(python_executable, timeout)
+    # One entry per interpreter, overwritten when its directories change, so
+    # installs and removals do not leave stale entries behind.
+    key = cache_key(os.path.realpath(python_executable))
+    entry = load_cached_object(_PACKAGES_CACHE_NAMESPACE, key)
+    if isinstance(entry, tuple) and len(entry) == 2 and entry[0] == stamp:
+        return dict(entry[1])
+    packages = _collect_installed_packages(python_executable, timeout)
+    store_cached_object(_PACKAGES_CACHE_NAMESPACE, key, (stamp, packages))
+    return packages
+
+
+def _package_directories_stamp(python_executable: Path) -> Optional[Tuple[Tuple[str, int], ...]]:
+    # Installing or removing a distribution adds or deletes an entry in
+    # site-packages (and conda-meta), which bumps the directory mtime.
+    directories = _site_packages_directories(python_executable)
+    if not directories:
+        return None
+    directories.append(_environment_root(python_executable) / "conda-meta")
+    stamp: List[Tuple[str, int]] = []
+    for directory in directories:
+        try:
+            stamp.append((str(directory), directory.stat().st_mtime_ns))
+        except OSError:
+            continue
+    return tuple(stamp)
+
+
+def _collect_installed_packages(python_executable: Path, timeout: int) -> Dict[str, str]:
+    site_packages = _scan_site_packages(python_executable)
+    if not site_packages:
+        LOGGER.debug("No package metadata found on disk for %s; falling back to pip", python_executable)
+        site_packages = _pip_installed_packages(python_executable, timeout)
+    # conda-meta only knows about conda-installed packages, so it fills the
+    # gaps while the Python-level metadata keeps precedence.
+    packages = _scan_conda_meta(_environment_root(python_executable))
+    packages.update(site_packages)
+    return packages
+
+
+def conda_meta_mtime(python_executable: Path) -> Optional[int]:
+    try:
+        return (_environment_root(python_executable) / "conda-meta").stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def _environment_root(python_executable: Path) -> Path:
+    parent = python_executable.parent
+    if parent.name in ("bin", "Scripts"):
+        return parent.parent
+    return parent
+
+
+def _site_packages_directories(python_executable: Path) -> List[Path]:
+    root = _environment_root(python_executable)
+    if not _has_isolated_site_packages(root):
+        return []
+    if sys.platform == "win32":
+        candidates = [root / "Lib" / "site-packages"]
+    else:
+        match = _VERSIONED_PYTHON_RE.fullmatch(python_executable.name)
+        if match:
+            candidates = [root / "lib" / f"python{match.group(1)}" / "site-packages"]
+        else:
+            candidates = sorted(root.glob("lib/python*/site-packages"))
+            if len(candidates) > 1:
+                # Several interpreters share this prefix; only pip can tell
+                # which directory belongs to the requested one.
+                return []
+    return [candidate for candidate in candidates if candidate.is_dir()]
+
+
+def _has_isolated_site_packages(root: Path) -> bool:
+    # Outside a conda env or an isolated venv, user site-packages, lib64 and
+    # the system prefix can all add distributions that only pip sees.
+    if (root / "conda-meta").is_dir():
+        return True
+    try:
+        pyvenv = (root / "pyvenv.cfg").read_text(encoding="utf-8", errors="replace")
+    except OSError:
+        return False
+    match = _PYVENV_SYSTEM_SITE_RE.search(pyvenv)
+    return match is None or match.group(1).lower() != "true"
+
+
+def _scan_site_packages(python_executable: Path) -> Dict[str, str]:
+    packages: Dict[str, str] = {}
+    for directory in _site_packages_directories(python_executable):
+        try:
+            entries = list(directory.iterdir())
+        except OSError as exc:
+            LOGGER.debug("Could not list %s: %s", directory, exc)
+            continue
+        for entry in entries:
+            if entry.suffix == ".dist-info":
+                # Installers name the directory <name>-<version>.dist-info, so
+                # METADATA only needs reading when that name is non-standard.
+                name, _, version = entry.stem.rpartition("-")
+                if name and version[:1].isdigit():
+                    packages.setdefault(normalise_name(name), version)
+                    continue
+                metadata_path = entry / "METADATA"
+            elif entry.suffix == ".egg-info":
+                metadata_path = entry / "PKG-INFO" if entry.is_dir() else entry
+            else:
+                continue
+            parsed = _read_metadata_header(metadata_path)
+            if parsed is not None:
+                packages.setdefault(normalise_name(parsed[0]), parsed[1])
+    return packages
+
+
+def _scan_conda_meta(env_root: Path) -> Dict[str, str]:
+    packages: Dict[str, str] = {}
+    for record_path in (env_root / "conda-meta").glob("*.json"):
+        # conda names each record <name>-<version>-<build>.json.
+        parts = record_path.stem.rsplit("-", 2)
+        if len(parts) != 3 or not all(parts):
+            continue
+        name = normalise_name(parts[0])
+        packages[name] = parts[1]
+        pypi_name = _CONDA_TO_PYPI_NAMES.get(name)
+        if pypi_name:
+            packages.setdefault(pypi_name, parts[1])
+    return packages
+
+
+def _read_metadata_header(path: Path) -> Optional[Tuple[str, str]]:
+    try:
+        with path.open("r", encoding="utf-8", errors="replace") as handle:
+            header = handle.read(4096)
+    except OSError as exc:
+        LOGGER.debug("Could not read package metadata %s: %s", path, exc)
+        return None
+    name = _METADATA_NAME_RE.search(header)
+    version = _METADATA_VERSION_RE.search(header)
+    if not name or not version:
+        return None
+    return name.group(1), version.group(1)
+
+
+def _pip_installed_packages(python_executable: Path, timeout: int) -> Dict[str, str]:
     try:
         result = subprocess.run(
             [str(python_executable), "-m", "pip", "list", "--format=json"],
             capture_output=True,
-            text=True,
             check=True,
             timeout=timeout,
         )
-    except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired) as exc:
+    except (OSError, subprocess.TimeoutExpired) as exc:
+        # pip freeze would hit the same missing interpreter or hang again.
+        LOGGER.warning("pip list failed for %s: %s", python_executable, exc)
+        return {}
+    except subprocess.CalledProcessError as exc:
         LOGGER.debug("pip list failed for %s: %s", python_executable, exc)
     else:
         try:
-            data = json.loads(result.stdout)
+            data = _jsonlib.loads(result.stdout)
             return {normalise_name(pkg["name"]): pkg["version"] for pkg in data}
         except json.JSONDecodeError as exc:
             LOGGER.debug("pip list JSON parse failed for %s: %s", python_executable, exc)
@@ -48,21 +247,18 @@ def get_installed_packages(python_executable: Path, timeout: int = 60) -> Dict[s
             capture_output=True,
             text=True,
             check=True,
-            timeout=timeout,
+            timeout=min(timeout, 20),
         )
     except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired) as exc:
         LOGGER.warning("pip freeze failed for %s: %s", python_executable, exc)
         return {}
-    packages: Dict[str, str] = {}
-    for line in result.stdout.splitlines():
-        if "==" not in line:
-            continue
-        name, version = line.split("==", 1)
-        packages[normalise_name(name.strip())] = version.strip()
-    return packages
+    return {normalise_name(match.group(1)): match.group(2) for match in _FREEZE_LINE_RE.finditer(result.stdout)}
 
 
 def get_python_version(python_executable: Path) -> Optional[str]:
+    version = _python_version_from_files(python_executable)
+    if version:
+        return version
     try:
         result = subprocess.run(
             [str(python_executable), "--version"],
@@ -75,75 +271,142 @@ def get_python_version(python_executable: Path) -> Optional[str]:
         LOGGER.warning("Python version detection failed for %s: %s", python_executable, exc)
         return None
     output = f"{result.stdout.strip()} {result.stderr.strip()}".strip()
-    match = re.search(r"Python\s*(\d+\.\d+(?:\.\d+)?)", output)
+    match = _PYTHON_VERSION_OUTPUT_RE.search(output)
     return match.group(1) if match else None
 
 
+def _python_version_from_files(python_executable: Path) -> Optional[str]:
+    if os.path.realpath(python_executable) == os.path.realpath(sys.executable):
+        return platform.python_version()
+    root = _environment_root(python_executable)
+    try:
+        pyvenv = (root / "pyvenv.cfg").read_text(encoding="utf-8", errors="replace")
+    except OSError:
+        pass
+    else:
+        match = _PYVENV_VERSION_RE.search(pyvenv)
+        if match:
+            return match.group(1)
+    for record_path in sorted((root / "conda-meta").glob("python-[0-9]*.json")):
+        # The record name is python-<version>-<build>.json; the JSON body is
+        # only needed if that naming is ever not followed.
+        name, _, version = record_path.stem.rpartition("-")[0].partition("-")
+        if name == "python" and version[:1].isdigit():
+            return version
+        try:
+            record = _jsonlib.loads(record_path.read_bytes())
+        except (OSError, ValueError) as exc:
+            LOGGER.debug("Could not read conda record %s: %s", record_path, exc)
+            continue
+        version = record.get("version") if isinstance(record, dict) else None
+        if isinstance(version, str) and version:
+            return version
+    return None
+
+
 def evaluate_marker(marker: Optional[str], python_version: Optional[str]) -> bool:
     if not marker:
         return True
+    return _evaluate_marker_cached(marker, python_version)
+
+
+@functools.lru_cache(maxsize=1024)
+def _evaluate_marker_cached(marker: str, python_version: Optional[str]) -> bool:
+    # The remaining marker variables describe the host, which is fixed for
+    # the lifetime of the process, so they do not need to be in the key.
     if python_version:
         base_version = ".".join(python_version.split(".")[:2])
     else:
         base_version = platform.python_version()
         python_version = platform.python_version()
-    env = {
-        "python_version": base_version,
-        "python_full_version": python_version,
-        "sys_platform": sys.platform,
-        "platform_system": platform.system(),
-        "platform_machine": platform.machine(),
-    }
+    env = dict(_host_marker_environment())
+    env["python_version"] = base_version
+    env["python_full_version"] = python_version
     try:
-        return Marker(marker).evaluate(env)
+        return _parse_marker(marker).evaluate(env)
     except Exception as exc:  # packaging does not expose a specific error
         LOGGER.warning("Failed to evaluate marker %s: %s", marker, exc)
         return True
 
 
+@functools.lru_cache(maxsize=1)
+def _host_marker_environment() -> Dict[str, str]:
+    return {
+        "sys_platform": sys.platform,
+        "platform_system": platform.system(),
+        "platform_machine": platform.machine(),
+    }
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_marker(marker: str) -> Marker:
+    # Parsed once per marker string, however many Python versions it is
+    # evaluated against.
+    return Marker(marker)
+
+
 def check_version(installed: str, specs: Sequence[RequirementSpec], package: str) -> bool:
     if not specs:
         return True
+    if len(specs) == 1 and specs[0].operator == "==" and specs[0].version == installed:
+        # An exact pin that matches verbatim needs no version parsing.
+        return True
+    return _check_version_cached(installed, tuple(specs), package)
+
+
+@functools.lru_cache(maxsize=4096)
+def _check_version_cached(installed: str, specs: Tuple[RequirementSpec, ...], package: str) -> bool:
     try:
-        installed_version = Version(installed)
+        installed_version = _parse_version(installed)
     except InvalidVersion:
         LOGGER.warning("Invalid installed version %s for %s", installed, package)
         return False
-    requirement_specs = list(specs)
-    if normalise_name(package) == "python":
-        adjusted: List[RequirementSpec] = []
-        for spec in requirement_specs:
-            if spec.operator == "==" and len(spec.version.split(".")) == 2:
-                adjusted.append(RequirementSpec("~=", spec.version))
-            else:
-                adjusted.append(spec)
-        requirement_specs = adjusted
-    spec_expression = ",".join(f"{item.operator}{item.version}" for item in requirement_specs)
+    spec_expression = _spec_expression(specs, normalise_name(package) == "python")
     try:
-        spec_set = SpecifierSet(spec_expression)
+        spec_set = _specifier_set(spec_expression)
     except InvalidSpecifier:
         LOGGER.warning("Invalid specifier %s for %s", spec_expression, package)
         return True
     return installed_version in spec_set
 
 
+@functools.lru_cache(maxsize=1024)
+def _spec_expression(specs: Tuple[RequirementSpec, ...], is_python: bool) -> str:
+    # Built once per requirement rather than once per (environment, requirement).
+    parts: List[str] = []
+    for spec in specs:
+        if is_python and spec.operator == "==" and len(spec.version.split(".")) == 2:
+            parts.append(f"~={spec.version}")
+        else:
+            parts.append(f"{spec.operator}{spec.version}")
+    return ",".join(parts)
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_version(version: str) -> Version:
+    return Version(version)
+
+
+@functools.lru_cache(maxsize=1024)
+def _specifier_set(expression: str) -> SpecifierSet:
+    return SpecifierSet(expression)
+
+
 def inspect_environment(
     name: str,
     python_executable: Path,
     requirements: Sequence[PackageRequirement],
 ) -> EnvironmentReport:
-    packages = get_installed_packages(python_executable)
+    # Environments already run in parallel in the CLI, so the two lookups
+    # here stay sequential.
     python_version = get_python_version(python_executable)
+    packages = get_installed_packages(python_executable)
     matching: List[str] = []
     missing: List[str] = []
     mismatched: List[str] = []
-    applicable = 0
-    for requirement in requirements:
-        if not evaluate_marker(requirement.marker, python_version):
-            continue
-        applicable += 1
-        key = normalise_name(requirement.name)
-        installed = packages.get(key)
+    applicable = _applicable_requirements(requirements, python_version)
+    for requirement in applicable:
+        installed = packages.get(normalise_name(requirement.name))
         if installed is None:
             missing.append(requirement.name)
             continue
@@ -151,7 +414,7 @@ def inspect_environment(
             matching.append(requirement.name)
         else:
             mismatched.append(requirement.name)
-    compatibility = (len(matching) / applicable * 100) if applicable else 100.0
+    compatibility = (len(matching) / len(applicable) * 100) if applicable else 100.0
     return EnvironmentReport(
         name=name,
         python_executable=python_executable,
@@ -160,72 +423,169 @@ def inspect_environment(
         matching=matching,
         missing=missing,
         mismatched=mismatched,
-        total_requirements=applicable,
+        total_requirements=len(applicable),
     )
 
 
+def _applicable_requirements(
+    requirements: Sequence[PackageRequirement],
+    python_version: Optional[str],
+) -> List[PackageRequirement]:
+    markers = tuple(requirement.marker for requirement in requirements)
+    return [requirements[index] for index in _applicable_indexes(markers, python_version)]
+
+
+@functools.lru_cache(maxsize=64)
+def _applicable_indexes(markers: Tuple[Optional[str], ...], python_version: Optional[str]) -> Tuple[int, ...]:
+    # Markers only depend on the interpreter version and the host platform,
+    # so environments sharing a Python version share the filtered list.
+    return tuple(index for index, marker in enumerate(markers) if evaluate_marker(marker, python_version))
+
+
 def find_conda_executable(candidate: Optional[str] = None) -> Optional[Path]:
-    candidates: List[Path] = []
-    if candidate:
-        candidates.append(Path(candidate))
     saved = load_conda_path()
+    search_paths = tuple(load_conda_search_paths())
+    key = _conda_lookup_key(candidate, saved, search_paths)
+    cached = _RESOLVED_CONDA.get(key)
+    if cached is not None:
+        return cached
+    preferred: List[Path] = []
+    if candidate:
+        preferred.append(Path(candidate))
     if saved:
-        candidates.append(Path(saved))
-    for extra in load_conda_search_paths():
-        extra_path = Path(extra)
-        if extra_path.is_file():
-            candidates.append(extra_path)
-            continue
-        if extra_path.is_dir():
-            candidates.extend(_expand_conda_from_directory(extra_path))
-        else:
-            candidates.append(extra_path)
+        preferred.append(Path(saved))
     env_var = os.environ.get("CONDA_EXE")
     if env_var:
-        candidates.append(Path(env_var))
-    for path_entry in os.environ.get("PATH", "").split(os.pathsep):
-        if not path_entry:
-            continue
-        entry_path = Path(path_entry)
-        names = ["conda"]
-        if sys.platform == "win32":
-            names = ["conda.exe", "conda.bat", "conda"]
-        for name in names:
-            candidate_path = entry_path / name
-            if candidate_path.exists():
-                candidates.append(candidate_path)
-    default_candidates = _default_conda_locations()
-    candidates.extend(default_candidates)
-    seen: set[Path] = set()
-    for path_candidate in candidates:
-        normalised = path_candidate.resolve() if path_candidate.exists() else path_candidate
-        if normalised in seen:
-            continue
-        seen.add(normalised)
-        if _validate_conda(normalised):
-            save_conda_path(str(normalised))
-            return normalised
+        preferred.append(Path(env_var))
+    # Dedupe on the spelling only; resolving every candidate costs a readlink
+    # per path component, so only the winner is resolved.
+    tried = _dedup_paths(preferred)
+    # The explicit candidate, the saved path or an activated conda's
+    # CONDA_EXE normally settle it without expanding any search location.
+    found = next((path for path in tried if _validate_conda(path)), None)
+    if found is None:
+        # Discovered candidates that look like a conda install are validated
+        # first, so the common case spawns a single ``conda --version``.
+        ranked = sorted(_iter_discovered_conda(search_paths), key=_conda_candidate_rank)
+        candidates = [path for _, path in ranked]
+        found = _first_valid_conda(_dedup_paths(tried + candidates)[len(tried):])
+    if found is None:
+        return None
+    found = Path(os.path.realpath(found))
+    save_conda_path(str(found))
+    if len(_RESOLVED_CONDA) >= 8:
+        _RESOLVED_CONDA.clear()
+    _RESOLVED_CONDA[key] = found
+    # Saving changes the saved path, and with it the key for the next call.
+    _RESOLVED_CONDA[_conda_lookup_key(candidate, str(found), search_paths)] = found
+    return found
+
+
+def _iter_discovered_conda(search_paths: Iterable[str]) -> Iterator[Tuple[int, Path]]:
+    # Each candidate is tagged with its source so that configured search
+    # paths keep precedence over PATH, and PATH over the default locations.
+    for extra in search_paths:
+        if _is_directory(extra):
+            for path in _expand_conda_from_directory(Path(extra)):
+                yield 0, path
+        else:
+            yield 0, Path(extra)
+    for path in _conda_on_path():
+        yield 1, path
+    for path in _default_conda_locations():
+        yield 2, path
+
+
+def _conda_lookup_key(candidate: Optional[str], saved: Optional[str], search_paths: Tuple[str, ...]) -> _CondaLookupKey:
+    # Everything the candidate list is built from, so a changed PATH,
+    # CONDA_EXE or configuration triggers a fresh search.
+    return (candidate or None, saved, search_paths, os.environ.get("PATH"), os.environ.get("CONDA_EXE"))
+
+
+def _conda_on_path() -> List[Path]:
+    # Same lookup as shutil.which for each name, but PATH is split once.
+    hits: List[Path] = []
+    entries = _path_entries()
+    for name in _CONDA_EXECUTABLE_NAMES:
+        for entry in entries:
+            path = Path(entry) / name
+            if _is_executable_file(path):
+                hits.append(path)
+                break
+    return hits
+
+
+def _path_entries() -> Tuple[str, ...]:
+    global _PATH_CACHE
+    raw = os.environ.get("PATH", "")
+    if _PATH_CACHE is None or _PATH_CACHE[0] != raw:
+        _PATH_CACHE = (raw, tuple(entry for entry in raw.split(os.pathsep) if entry))
+    return _PATH_CACHE[1]
+
+
+def clear_conda_cache() -> None:
+    _RESOLVED_CONDA.clear()
+    _conda_reports_version.cache_clear()
+
+
+def _first_valid_conda(candidates: Sequence[Path]) -> Optional[Path]:
+    existing = [path for path in candidates if _is_executable_file(path)]
+    if not existing:
+        return None
+    if _validate_conda(existing[0]):
+        return existing[0]
+    remaining = existing[1:]
+    if not remaining:
+        return None
+    # The preferred candidate failed; probe the rest concurrently so a stale
+    # entry that hangs until the timeout does not delay every later one.
+    with ThreadPoolExecutor(max_workers=min(8, len(remaining))) as executor:
+        results = list(executor.map(_validate_conda, remaining))
+    for path, valid in zip(remaining, results):
+        if valid:
+            return path
     return None
 
 
+def _conda_candidate_rank(item: Tuple[int, Path]) -> Tuple[int, int]:
+    # The layout heuristic only reorders candidates within one source.
+    source, path = item
+    if path.name not in _CONDA_EXECUTABLE_NAMES:
+        return source, 2
+    if path.parent.name in _CONDA_INSTALL_DIRECTORIES:
+        return source, 0
+    return source, 1
+
+
 def _expand_conda_from_directory(directory: Path) -> List[Path]:
-    names = ["conda"]
-    if sys.platform == "win32":
-        names = ["conda.exe", "conda.bat", "conda"]
-        subdirectories = [Path(""), Path("Scripts"), Path("condabin")]
-    else:
-        subdirectories = [Path(""), Path("bin"), Path("condabin")]
-    candidates: List[Path] = []
-    for subdirectory in subdirectories:
-        for name in names:
-            candidate = directory / subdirectory / name
-            candidates.append(candidate)
-    return candidates
+    # One listing per subdirectory instead of a stat per (subdirectory, name).
+    found: List[Path] = []
+    for subdirectory in _CONDA_SUBDIRECTORIES:
+        parent = directory / subdirectory
+        try:
+            with os.scandir(parent) as entries:
+                present = {os.path.normcase(entry.name) for entry in entries}
+        except OSError:
+            continue
+        found.extend(parent / name for name in _CONDA_EXECUTABLE_NAMES if os.path.normcase(name) in present)
+    return found
 
 
 def _validate_conda(path: Path) -> bool:
-    if not path.exists():
+    # Only files that exist are memoised, keyed on their mtime, so a conda
+    # installed or replaced later in the process is still picked up.
+    try:
+        file_stat = os.stat(path)
+    except OSError:
+        return False
+    if not _is_executable_mode(file_stat.st_mode):
         return False
+    return _conda_reports_version(str(path), file_stat.st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=64)
+def _conda_reports_version(executable: str, mtime_ns: int) -> bool:
+    path = Path(executable)
     try:
         result = subprocess.run(
             [str(path), "--version"],
@@ -248,28 +608,34 @@ def _validate_conda(path: Path) -> bool:
 
 
 def _default_conda_locations() -> Iterable[Path]:
-    if sys.platform == "win32":
+    # expanduser reads USERPROFILE/HOME, so the cache follows a changed home.
+    return _build_default_conda_locations(sys.platform, os.path.expanduser("~"))
+
+
+@functools.lru_cache(maxsize=4)
+def _build_default_conda_locations(platform_name: str, home: str) -> Tuple[Path, ...]:
+    home_path = Path(home)
+    if platform_name == "win32":
+        locations: List[Path] = []
         prefixes = [
             Path("C:/ProgramData/Anaconda3"),
             Path("C:/ProgramData/miniconda3"),
-            Path.home() / "Anaconda3",
-            Path.home() / "miniconda3",
-        ]
-        for prefix in prefixes:
-            yield prefix / "Scripts" / "conda.exe"
-            yield prefix / "condabin" / "conda.bat"
-        yield Path("C:/webui/installer_files/conda/condabin/conda.bat")
-        yield Path("C:/webui/installer_files/conda/Scripts/conda.exe")
-    else:
-        prefixes = [
-            Path.home() / "miniconda3" / "bin" / "conda",
-            Path.home() / "anaconda3" / "bin" / "conda",
-            Path("/opt/conda/bin/conda"),
-            Path("/usr/local/anaconda3/bin/conda"),
-            Path("/usr/local/miniconda3/bin/conda"),
+            home_path / "Anaconda3",
+            home_path / "miniconda3",
         ]
         for prefix in prefixes:
-            yield prefix
+            locations.append(prefix / "Scripts" / "conda.exe")
+            locations.append(prefix / "condabin" / "conda.bat")
+        locations.append(Path("C:/webui/installer_files/conda/condabin/conda.bat"))
+        locations.append(Path("C:/webui/installer_files/conda/Scripts/conda.exe"))
+        return tuple(locations)
+    return (
+        home_path / "miniconda3" / "bin" / "conda",
+        home_path / "anaconda3" / "bin" / "conda",
+        Path("/opt/conda/bin/conda"),
+        Path("/usr/local/anaconda3/bin/conda"),
+        Path("/usr/local/miniconda3/bin/conda"),
+    )
 
 
 def list_conda_environments(conda_executable: Path) -> List[Path]:
@@ -277,7 +643,6 @@ def list_conda_environments(conda_executable: Path) -> List[Path]:
         result = subprocess.run(
             [str(conda_executable), "env", "list", "--json"],
             capture_output=True,
-            text=True,
             check=True,
             timeout=30,
         )
@@ -285,40 +650,99 @@ def list_conda_environments(conda_executable: Path) -> List[Path]:
         LOGGER.warning("conda env list failed for %s: %s", conda_executable, exc)
         return []
     try:
-        payload = json.loads(result.stdout)
+        payload = _jsonlib.loads(result.stdout)
     except json.JSONDecodeError as exc:
         LOGGER.warning("conda env list JSON decode failed for %s: %s", conda_executable, exc)
         return []
-    envs = payload.get("envs", [])
-    return [Path(env).resolve() for env in envs if Path(env).exists()]
+    environments: List[Path] = []
+    for env in payload.get("envs", []):
+        if not isinstance(env, str):
+            continue
+        env_path = _conda_env_directory(env)
+        if env_path is not None:
+            environments.append(Path(env_path))
+    return _dedup_paths(environments)
+
+
+def _conda_env_directory(env: str) -> Optional[str]:
+    # One lstat tells a plain directory apart from a symlink; only symlinks
+    # need a second stat and a realpath walk.
+    try:
+        mode = os.lstat(env).st_mode
+    except OSError:
+        return None
+    if stat.S_ISDIR(mode):
+        return os.path.abspath(env)
+    if stat.S_ISLNK(mode) and _is_directory(env):
+        return os.path.realpath(env)
+    return None
+
+
+def _dedup_paths(paths: Iterable[Path]) -> List[Path]:
+    unique: List[Path] = []
+    seen: set[str] = set()
+    for path in paths:
+        key = os.path.normcase(os.path.normpath(str(path)))
+        if key in seen:
+            continue
+        seen.add(key)
+        unique.append(path)
+    return unique
+
+
+def _is_directory(path: str) -> bool:
+    try:
+        return stat.S_ISDIR(os.stat(path).st_mode)
+    except OSError:
+        return False
+
+
+def _is_executable_file(path: Path) -> bool:
+    # A single stat answers "exists", "is a regular file" and "is executable".
+    try:
+        mode = os.stat(path).st_mode
+    except OSError:
+        return False
+    return _is_executable_mode(mode)
+
+
+def _is_executable_mode(mode: int) -> bool:
+    if not stat.S_ISREG(mode):
+        return False
+    # Windows has no execute bits; .bat launchers are handled in _validate_conda.
+    return sys.platform == "win32" or bool(mode & (stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH))
 
 
 def resolve_python_executable(env_path: Path) -> Optional[Path]:
-    candidates = [env_path / "python"]
-    if sys.platform == "win32":
-        candidates = [env_path / "python.exe", env_path / "Scripts" / "python.exe"]
-    else:
-        candidates.append(env_path / "bin" / "python")
-    for candidate in candidates:
-        if candidate.exists():
-            return candidate.resolve()
+    for relative_path in _PYTHON_RELATIVE_PATHS:
+        try:
+            # A strict resolve fails for missing files, so no separate stat
+            # is needed before following symlinks.
+            return (env_path / relative_path).resolve(strict=True)
+        except OSError:
+            continue
     return None
 
 
 def infer_python_version(requirements: Sequence[PackageRequirement]) -> Optional[str]:
-    python_specs: List[str] = []
-    for requirement in requirements:
-        if normalise_name(requirement.name) != "python":
-            continue
-        for spec in requirement.specs:
-            python_specs.append(f"{spec.operator}{spec.version}")
+    python_specs = tuple(
+        f"{spec.operator}{spec.version}"
+        for requirement in requirements
+        if normalise_name(requirement.name) == "python"
+        for spec in requirement.specs
+    )
     if not python_specs:
         return None
+    return _infer_python_version_cached(python_specs)
+
+
+@functools.lru_cache(maxsize=32)
+def _infer_python_version_cached(python_specs: Tuple[str, ...]) -> Optional[str]:
     try:
-        spec_set = SpecifierSet(",".join(python_specs))
+        spec_set = _specifier_set(",".join(python_specs))
     except InvalidSpecifier:
         return None
-    for version in ["3.12", "3.11", "3.10", "3.9", "3.8"]:
-        if Version(version + ".0") in spec_set:
+    for version, release in _CANDIDATE_PYTHON_VERSIONS:
+        if release in spec_set:
             return version
     return None
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 
 @dataclass(frozen=True)
@@ -14,7 +14,7 @@ class RequirementSpec:
 @dataclass(frozen=True)
 class PackageRequirement:
     name: str
-    specs: List[RequirementSpec] = field(default_factory=list)
+    specs: Tuple[RequirementSpec, ...] = ()
     marker: Optional[str] = None
     url: Optional[str] = None
     original: Optional[str] = None
@@ -1,12 +1,16 @@
 from __future__ import annotations
 
-import json
-from dataclasses import asdict
+from operator import attrgetter
 from typing import Iterable, List, Optional, Sequence
 
+from . import _jsonlib
 from .models import EnvironmentReport
 
 
+_RULE = "=" * 72
+_SUMMARY_HEADER = f"{_RULE}\nEnvironment compatibility summary\n{_RULE}"
+
+
 def format_reports(
     reports: Sequence[EnvironmentReport],
     recommended_python: Optional[str] = None,
@@ -14,36 +18,45 @@ def format_reports(
 ) -> str:
     if not reports:
         return "No environments were inspected."
-    sorted_reports = sorted(reports, key=lambda item: item.compatibility, reverse=True)
-    lines: List[str] = []
-    lines.append("=" * 72)
-    lines.append("Environment compatibility summary")
-    lines.append("=" * 72)
+    sorted_reports = sorted(reports, key=attrgetter("compatibility"), reverse=True)
+    lines: List[str] = [_SUMMARY_HEADER]
     if recommended_python:
         lines.append(f"Recommended Python version: {recommended_python}")
         lines.append("")
     for report in sorted_reports:
-        lines.append(_format_single_report(report, include_paths))
-    return "\n".join(line for line in lines if line is not None)
+        _append_report_lines(lines, report, include_paths)
+    return "\n".join(lines)
 
 
-def _format_single_report(report: EnvironmentReport, include_paths: bool) -> str:
+def _append_report_lines(lines: List[str], report: EnvironmentReport, include_paths: bool) -> None:
     name_line = report.name
     if report.python_version:
         name_line = f"{name_line} (Python {report.python_version})"
     if include_paths:
         name_line = f"{name_line} -> {report.python_executable}"
-    lines = [name_line]
+    lines.append(name_line)
     lines.append(f"Compatibility: {report.compatibility:.1f}% of {report.total_requirements} applicable requirements")
-    if report.matching:
-        lines.append("Matches: " + ", ".join(sorted(report.matching)))
-    if report.missing:
-        lines.append("Missing: " + ", ".join(sorted(report.missing)))
-    if report.mismatched:
-        lines.append("Version conflicts: " + ", ".join(sorted(report.mismatched)))
-    return "\n".join(lines)
+    matching, missing, mismatched = report.matching, report.missing, report.mismatched
+    if matching:
+        lines.append(f"Matches: {', '.join(sorted(matching))}")
+    if missing:
+        lines.append(f"Missing: {', '.join(sorted(missing))}")
+    if mismatched:
+        lines.append(f"Version conflicts: {', '.join(sorted(mismatched))}")
 
 
 def reports_to_json(reports: Iterable[EnvironmentReport]) -> str:
-    payload = [asdict(report) for report in reports]
-    return json.dumps(payload, indent=2, default=str)
+    payload = [
+        {
+            "name": report.name,
+            "python_executable": str(report.python_executable),
+            "python_version": report.python_version,
+            "compatibility": report.compatibility,
+            "matching": report.matching,
+            "missing": report.missing,
+            "mismatched": report.mismatched,
+            "total_requirements": report.total_requirements,
+        }
+        for report in reports
+    ]
+    return _jsonlib.dumps(payload, indent=True)
@@ -1,25 +1,70 @@
 from __future__ import annotations
 
+import functools
 import logging
+import os
+import re
 from pathlib import Path
-from typing import Iterable, List, Optional, Sequence, Tuple
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
 
 from packaging.requirements import InvalidRequirement, Requirement
 
+from .cache import cache_key, load_cached_object, store_cached_object
 from .models import PackageRequirement, RequirementSpec
 
 
 LOGGER = logging.getLogger(__name__)
 
+_CACHE_NAMESPACE = "requirements"
+# (requirement, extra index URL) for a line, or None when it carries neither.
+_ParsedLine = Optional[Tuple[Optional[PackageRequirement], Optional[str]]]
+_BARE_NAME_RE = re.compile(r"[A-Za-z0-9](?:[A-Za-z0-9._-]*[A-Za-z0-9])?")
+
 
 def parse_requirements(path: Path) -> Tuple[List[PackageRequirement], List[str]]:
+    try:
+        file_stat = path.stat()
+    except OSError:
+        parsed = _parse_requirements_file(path)
+    else:
+        parsed = _load_requirements(os.path.realpath(path), file_stat.st_mtime_ns, file_stat.st_size)
+    requirements, extra_indexes, warnings = parsed
+    # Warnings are reported on every call, whichever cache answered it.
+    for message in warnings:
+        LOGGER.warning("%s", message)
+    return list(requirements), list(extra_indexes)
+
+
+@functools.lru_cache(maxsize=32)
+def _load_requirements(real_path: str, mtime_ns: int, size: int) -> Tuple[
+    Tuple[PackageRequirement, ...], Tuple[str, ...], Tuple[str, ...]
+]:
+    # Repeat calls in one process stop here; the disk cache below carries
+    # results across processes. One disk entry per requirements file,
+    # overwritten when the file changes, so edits do not leave stale
+    # entries behind in the cache directory.
+    key = cache_key(real_path)
+    stamp = (mtime_ns, size)
+    entry = load_cached_object(_CACHE_NAMESPACE, key)
+    if isinstance(entry, tuple) and len(entry) == 2 and entry[0] == stamp:
+        requirements, extra_indexes, warnings = entry[1]
+    else:
+        requirements, extra_indexes, warnings = _parse_requirements_file(Path(real_path))
+        store_cached_object(_CACHE_NAMESPACE, key, (stamp, (requirements, extra_indexes, warnings)))
+    return tuple(requirements), tuple(extra_indexes), tuple(warnings)
+
+
+def _parse_requirements_file(path: Path) -> Tuple[List[PackageRequirement], List[str], List[str]]:
     requirements: List[PackageRequirement] = []
     extra_indexes: List[str] = []
+    # Warnings are returned rather than logged so that cached results can
+    # report them too.
+    warnings: List[str] = []
     for line_number, line in enumerate(path.read_text(encoding="utf-8").splitlines(), start=1):
         try:
             parsed = parse_requirement_line(line)
         except InvalidRequirement as exc:
-            LOGGER.warning("Invalid requirement at line %s: %s", line_number, exc)
+            warnings.append(f"Invalid requirement at line {line_number}: {exc}")
             continue
         if parsed is None:
             continue
@@ -29,13 +74,24 @@ def parse_requirements(path: Path) -> Tuple[List[PackageRequirement], List[str]]
             continue
         if package is not None:
             requirements.append(package)
-    return requirements, extra_indexes
+    return requirements, extra_indexes, warnings
 
 
 def parse_requirement_line(line: str) -> Optional[Tuple[Optional[PackageRequirement], Optional[str]]]:
     stripped = line.strip()
-    if not stripped or stripped.startswith("#"):
+    if not stripped:
         return None
+    # Most lines are plain requirements; dispatching on the first character
+    # keeps them clear of the option and URL prefix checks.
+    handler = _LINE_HANDLERS.get(stripped[0], _parse_requirement_entry)
+    return handler(stripped)
+
+
+def _skip_line(stripped: str) -> None:
+    return None
+
+
+def _parse_option_line(stripped: str) -> _ParsedLine:
     if stripped.startswith("--extra-index-url"):
         parts = stripped.split(None, 1)
         if len(parts) == 2:
@@ -43,17 +99,36 @@ def parse_requirement_line(line: str) -> Optional[Tuple[Optional[PackageRequirem
         return (None, None)
     if stripped.startswith("--"):
         return None
-    if stripped.startswith(("http://", "https://", "git+")):
-        if "#egg=" in stripped:
-            egg_name = stripped.split("#egg=")[1].split("&")[0].strip()
-            return (_build_requirement(egg_name, [], stripped, stripped), None)
-        return None
-    base = stripped.split("#", 1)[0].strip()
+    return _parse_requirement_entry(stripped)
+
+
+def _parse_url_line(stripped: str) -> _ParsedLine:
+    if not stripped.startswith(("http://", "https://", "git+")):
+        return _parse_requirement_entry(stripped)
+    if "#egg=" in stripped:
+        egg_name = stripped.partition("#egg=")[2].partition("&")[0].strip()
+        return (_build_requirement(egg_name, (), stripped, stripped), None)
+    return None
+
+
+def _parse_requirement_entry(stripped: str) -> _ParsedLine:
+    base = stripped.partition("#")[0].strip()
     if not base:
         return None
+    if _BARE_NAME_RE.fullmatch(base):
+        # Unpinned names need none of the PEP 508 grammar.
+        return (_build_requirement(base, (), stripped, None), None)
     return (_parse_standard_requirement(base, stripped), None)
 
 
+_LINE_HANDLERS: Dict[str, Callable[[str], _ParsedLine]] = {
+    "#": _skip_line,
+    "-": _parse_option_line,
+    "h": _parse_url_line,
+    "g": _parse_url_line,
+}
+
+
 def parse_requirement_text(text: Sequence[str]) -> List[PackageRequirement]:
     requirements: List[PackageRequirement] = []
     for line in text:
@@ -73,12 +148,14 @@ def parse_single_requirement(requirement: str) -> PackageRequirement:
     return parsed[0]
 
 
+@functools.lru_cache(maxsize=2048)
 def _parse_standard_requirement(requirement: str, original: str) -> PackageRequirement:
+    # PackageRequirement is frozen, so cached instances can be shared.
     try:
         parsed = Requirement(requirement)
     except InvalidRequirement as exc:
         raise InvalidRequirement(requirement) from exc
-    specs = [RequirementSpec(spec.operator, spec.version) for spec in parsed.specifier]
+    specs = tuple(RequirementSpec(spec.operator, spec.version) for spec in parsed.specifier)
     marker = str(parsed.marker) if parsed.marker else None
     url = parsed.url
     return PackageRequirement(
@@ -93,7 +170,7 @@ def _parse_standard_requirement(requirement: str, original: str) -> PackageRequi
 def _build_requirement(name: str, specs: Iterable[RequirementSpec], original: str, url: Optional[str]) -> PackageRequirement:
     return PackageRequirement(
         name=name.lower(),
-        specs=list(specs),
+        specs=tuple(specs),
         marker=None,
         url=url,
         original=original,
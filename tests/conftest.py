@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import sys
 from pathlib import Path
+from types import SimpleNamespace
 from typing import List, Tuple
 
 ROOT_DIR = Path(__file__).resolve().parents[1]
@@ -11,7 +12,7 @@ if str(SRC_DIR) not in sys.path:
 
 import pytest
 
-from psypyenv import cli
+from psypyenv import cache, cli, config, environment, requirements
 
 
 @pytest.fixture(scope="session")
@@ -29,3 +30,72 @@ def _ensure_environment_locator_runs(discovered_environments):
     # The autouse fixture guarantees that the environment locator executes
     # before any tests access the interpreter details.
     return discovered_environments
+
+
+@pytest.fixture(scope="session")
+def fake_conda_tree(tmp_path_factory) -> SimpleNamespace:
+    # Read-only scaffolding shared by CLI tests: a stub conda executable and
+    # two environments with stub interpreters.
+    root = tmp_path_factory.mktemp("conda")
+    conda = root / "conda"
+    conda.write_text("#!/bin/sh\n")
+    conda.chmod(0o755)
+    envs = []
+    python_paths = {}
+    for name in ("alpha", "beta"):
+        env_dir = root / "envs" / name
+        env_dir.mkdir(parents=True)
+        python_path = env_dir / "python"
+        python_path.write_text("#!/bin/sh\n")
+        python_path.chmod(0o755)
+        envs.append(env_dir)
+        python_paths[env_dir] = python_path
+    return SimpleNamespace(conda=conda, envs=envs, python_paths=python_paths)
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache_dir(tmp_path, monkeypatch):
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr(cache, "_cache_root", lambda: cache_dir)
+    return cache_dir
+
+
+@pytest.fixture(autouse=True)
+def _reset_config_file_cache():
+    # _config_file is memoised per process; tests that change the config
+    # location (e.g. via XDG_CONFIG_HOME) need a fresh lookup.
+    config._config_file.cache_clear()
+    yield
+
+
+@pytest.fixture(autouse=True)
+def _reset_requirements_cache():
+    requirements._load_requirements.cache_clear()
+    yield
+
+
+@pytest.fixture(autouse=True)
+def _reset_conda_cache():
+    environment.clear_conda_cache()
+    yield
+
+
+@pytest.fixture
+def isolated_conda_env(monkeypatch):
+    # Hide the real configuration, PATH and default install locations from
+    # find_conda_executable; tests override whichever piece they exercise.
+    monkeypatch.setattr(environment, "load_conda_path", lambda: None)
+    monkeypatch.setattr(environment, "save_conda_path", lambda path: None)
+    monkeypatch.setattr(environment, "load_conda_search_paths", lambda: [])
+    monkeypatch.setattr(environment, "_default_conda_locations", lambda: [])
+    monkeypatch.delenv("CONDA_EXE", raising=False)
+    monkeypatch.setenv("PATH", "")
+    yield monkeypatch
+
+
+@pytest.fixture
+def isolated_settings(tmp_path, monkeypatch) -> Path:
+    # Point the configuration at a per-test settings.ini, which starts absent.
+    settings_path = tmp_path / "settings.ini"
+    monkeypatch.setattr(config, "_config_file", lambda: settings_path)
+    return settings_path
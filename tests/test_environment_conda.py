@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import json
 import logging
+import os
+import subprocess
 import sys
+import time
 from pathlib import Path
 
 import pytest
@@ -11,20 +15,13 @@ from psypyenv.models import EnvironmentReport
 from psypyenv.requirements import parse_requirement_text
 
 
-def test_find_conda_executable_returns_none_when_absent(monkeypatch) -> None:
-    monkeypatch.setattr(environment, "load_conda_path", lambda: None)
-    monkeypatch.setattr(environment, "save_conda_path", lambda path: None)
-    monkeypatch.setattr(environment, "load_conda_search_paths", lambda: [])
-    monkeypatch.setattr(environment, "_default_conda_locations", lambda: [])
-    monkeypatch.delenv("CONDA_EXE", raising=False)
-    monkeypatch.setenv("PATH", "")
-
+def test_find_conda_executable_returns_none_when_absent(isolated_conda_env) -> None:
     result = environment.find_conda_executable()
 
     assert result is None
 
 
-def test_find_conda_executable_uses_custom_paths(tmp_path, monkeypatch) -> None:
+def test_find_conda_executable_uses_custom_paths(tmp_path, isolated_conda_env, monkeypatch) -> None:
     custom_dir = tmp_path / "custom"
     custom_dir.mkdir()
     executable_name = "conda.exe" if sys.platform == "win32" else "conda"
@@ -34,12 +31,8 @@ def test_find_conda_executable_uses_custom_paths(tmp_path, monkeypatch) -> None:
 
     saves: list[str] = []
 
-    monkeypatch.setattr(environment, "load_conda_path", lambda: None)
     monkeypatch.setattr(environment, "save_conda_path", lambda path: saves.append(path))
     monkeypatch.setattr(environment, "load_conda_search_paths", lambda: [str(custom_dir)])
-    monkeypatch.setattr(environment, "_default_conda_locations", lambda: [])
-    monkeypatch.delenv("CONDA_EXE", raising=False)
-    monkeypatch.setenv("PATH", "")
 
     resolved = environment.find_conda_executable()
 
@@ -47,30 +40,61 @@ def test_find_conda_executable_uses_custom_paths(tmp_path, monkeypatch) -> None:
     assert saves and Path(saves[0]) == resolved
 
 
-def test_cli_include_conda_envs_reports_and_caches(tmp_path, monkeypatch, capsys, caplog) -> None:
+def test_find_conda_executable_prefers_earliest_valid_candidate(
+    tmp_path, isolated_conda_env, monkeypatch
+) -> None:
+    executable_name = "conda.exe" if sys.platform == "win32" else "conda"
+    directories = []
+    for name, output in (("broken", "not it"), ("first", "conda 24.1"), ("second", "conda 23.9")):
+        directory = tmp_path / name
+        directory.mkdir()
+        script = directory / executable_name
+        script.write_text(f"#!/bin/sh\necho '{output}'\n")
+        script.chmod(0o755)
+        directories.append(str(directory))
+
+    monkeypatch.setattr(environment, "load_conda_search_paths", lambda: directories)
+
+    resolved = environment.find_conda_executable()
+
+    assert resolved == (tmp_path / "first" / executable_name).resolve()
+
+
+def test_find_conda_executable_reuses_validated_saved_path(
+    tmp_path, isolated_conda_env, monkeypatch
+) -> None:
+    executable_name = "conda.exe" if sys.platform == "win32" else "conda"
+    candidate = tmp_path / executable_name
+    candidate.write_text("#!/bin/sh\necho 'conda 24.1'\n")
+    candidate.chmod(0o755)
+    saved = str(candidate.resolve())
+
+    validations: list[Path] = []
+    original_validate = environment._validate_conda
+
+    def counting_validate(path: Path) -> bool:
+        validations.append(path)
+        return original_validate(path)
+
+    monkeypatch.setattr(environment, "_validate_conda", counting_validate)
+    monkeypatch.setattr(environment, "load_conda_path", lambda: saved)
+
+    first = environment.find_conda_executable()
+    second = environment.find_conda_executable()
+
+    assert first == second == candidate.resolve()
+    assert len(validations) == 1
+
+
+def test_cli_include_conda_envs_reports_and_caches(
+    tmp_path, monkeypatch, capsys, caplog, fake_conda_tree, isolated_settings
+) -> None:
     requirements_path = tmp_path / "requirements.txt"
     requirements_path.write_text("requests==2.31.0\n")
 
-    settings_path = tmp_path / "settings.ini"
-    monkeypatch.setattr(config, "_config_file", lambda: settings_path)
-
-    fake_conda = tmp_path / "conda"
-    fake_conda.write_text("#!/bin/sh\n")
-    fake_conda.chmod(0o755)
-    monkeypatch.setattr(cli, "find_conda_executable", lambda candidate=None: fake_conda)
-
-    env_root = tmp_path / "envs"
-    env_root.mkdir()
-    python_paths: dict[Path, Path] = {}
-    environments = []
-    for name in ("alpha", "beta"):
-        env_dir = env_root / name
-        env_dir.mkdir()
-        python_path = env_dir / "python"
-        python_path.write_text("#!/bin/sh\n")
-        python_path.chmod(0o755)
-        environments.append(env_dir)
-        python_paths[env_dir] = python_path
+    monkeypatch.setattr(cli, "find_conda_executable", lambda candidate=None: fake_conda_tree.conda)
+    environments = fake_conda_tree.envs
+    python_paths = fake_conda_tree.python_paths
 
     manual_env = tmp_path / "manual" / "custom"
     manual_env.mkdir(parents=True)
@@ -182,3 +206,394 @@ def test_cli_main_reports_discovered_environments(discovered_environments, capsy
         assert env_name in output
     assert output.count("Compatibility:") == len(discovered_environments)
     assert output.lower().count("missing: django") == len(discovered_environments)
+
+
+def test_cli_warm_cache_skips_conda_discovery(
+    tmp_path, monkeypatch, capsys, isolated_settings
+) -> None:
+    requirements_path = tmp_path / "requirements.txt"
+    requirements_path.write_text("requests==2.31.0\n")
+
+    env_python = tmp_path / "envs" / "delta" / "python"
+    env_python.parent.mkdir(parents=True)
+    env_python.write_text("#!/bin/sh\n")
+    config.save_cached_conda_envs([("delta", str(env_python.resolve()))])
+
+    def unexpected_discovery(candidate=None):
+        raise AssertionError("conda should not be located when the cache is warm")
+
+    monkeypatch.setattr(cli, "find_conda_executable", unexpected_discovery)
+    monkeypatch.setattr(
+        cli,
+        "inspect_environment",
+        lambda name, path, requirements: EnvironmentReport(
+            name=name,
+            python_executable=path,
+            python_version="3.10",
+            compatibility=0.0,
+            matching=[],
+            missing=[requirement.name for requirement in requirements],
+            mismatched=[],
+            total_requirements=len(requirements),
+        ),
+    )
+
+    exit_code = cli.main(["--requirements", str(requirements_path), "--include-conda-envs"])
+
+    assert exit_code == 0
+    assert "delta" in capsys.readouterr().out
+
+
+def test_config_reads_are_cached_until_settings_change(isolated_settings) -> None:
+    config.save_conda_path("/opt/conda/bin/conda")
+
+    assert config._read_config() is config._read_config()
+    assert config.load_conda_path() == "/opt/conda/bin/conda"
+
+    isolated_settings.write_text("[conda]\npath = /usr/local/bin/conda-other\n", encoding="utf-8")
+    assert config.load_conda_path() == "/usr/local/bin/conda-other"
+
+
+def test_cached_conda_envs_accepts_legacy_list_payload(isolated_settings) -> None:
+    isolated_settings.write_text(
+        '[conda]\ncached_envs = [{"name": " alpha ", "path": "/envs/alpha/python"}, ["beta", "/envs/beta/python"], 3]\n',
+        encoding="utf-8",
+    )
+    assert config.load_cached_conda_envs() == [
+        ("alpha", "/envs/alpha/python"),
+        ("beta", "/envs/beta/python"),
+    ]
+
+    config.save_cached_conda_envs(config.load_cached_conda_envs())
+    assert '"_v"' in isolated_settings.read_text(encoding="utf-8")
+    assert config.load_cached_conda_envs() == [
+        ("alpha", "/envs/alpha/python"),
+        ("beta", "/envs/beta/python"),
+    ]
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX permissions and symlinks")
+def test_config_writes_keep_permissions_and_symlinks(tmp_path, isolated_settings) -> None:
+    real_settings = tmp_path / "dotfiles" / "settings.ini"
+    real_settings.parent.mkdir()
+    real_settings.write_text("[conda]\n", encoding="utf-8")
+    real_settings.chmod(0o640)
+    isolated_settings.symlink_to(real_settings)
+
+    config.save_conda_path("/opt/conda/bin/conda")
+
+    assert isolated_settings.is_symlink()
+    assert real_settings.stat().st_mode & 0o777 == 0o640
+    assert config.load_conda_path() == "/opt/conda/bin/conda"
+
+
+def test_lookup_cached_conda_env_without_full_load(monkeypatch, isolated_settings) -> None:
+    config.save_cached_conda_envs(
+        [("alpha", "/envs/alpha/python"), ("we\"ird", "C:\\envs\\weird\\python.exe")]
+    )
+
+    def unexpected_load():
+        raise AssertionError("tagged payloads should be scanned lazily")
+
+    monkeypatch.setattr(config, "load_cached_conda_envs", unexpected_load)
+    assert list(config.iter_cached_conda_env_names()) == ["alpha", "we\"ird"]
+    assert config.lookup_cached_conda_env("we\"ird") == "C:\\envs\\weird\\python.exe"
+    assert config.lookup_cached_conda_env("missing") is None
+
+
+def test_find_conda_executable_validates_conda_like_candidates_first(
+    tmp_path, isolated_conda_env, monkeypatch
+) -> None:
+    executable_name = "conda.exe" if sys.platform == "win32" else "conda"
+    wrapper = tmp_path / "tools" / "conda-wrapper"
+    installed = tmp_path / "miniconda" / "condabin" / executable_name
+    for script in (wrapper, installed):
+        script.parent.mkdir(parents=True)
+        script.write_text("#!/bin/sh\necho 'conda 24.1'\n")
+        script.chmod(0o755)
+
+    validations: list[Path] = []
+    original_validate = environment._validate_conda
+
+    def counting_validate(path: Path) -> bool:
+        validations.append(path)
+        return original_validate(path)
+
+    monkeypatch.setattr(environment, "_validate_conda", counting_validate)
+    monkeypatch.setattr(environment, "load_conda_search_paths", lambda: [str(wrapper), str(installed)])
+
+    assert environment.find_conda_executable() == installed.resolve()
+    assert validations == [installed]
+
+
+def test_find_conda_executable_prefers_configured_search_paths_over_path(
+    tmp_path, isolated_conda_env, monkeypatch
+) -> None:
+    executable_name = "conda.exe" if sys.platform == "win32" else "conda"
+    configured = tmp_path / "mytools" / executable_name
+    on_path = tmp_path / "usr" / "bin" / executable_name
+    for script in (configured, on_path):
+        script.parent.mkdir(parents=True)
+        script.write_text("#!/bin/sh\necho 'conda 24.1'\n")
+        script.chmod(0o755)
+
+    monkeypatch.setattr(environment, "load_conda_search_paths", lambda: [str(configured)])
+    monkeypatch.setenv("PATH", str(on_path.parent))
+
+    assert environment.find_conda_executable() == configured.resolve()
+
+
+def test_find_conda_executable_memo_follows_conda_exe(
+    tmp_path, isolated_conda_env, monkeypatch
+) -> None:
+    executable_name = "conda.exe" if sys.platform == "win32" else "conda"
+    installs = []
+    for name in ("one", "two"):
+        script = tmp_path / name / "bin" / executable_name
+        script.parent.mkdir(parents=True)
+        script.write_text("#!/bin/sh\necho 'conda 24.1'\n")
+        script.chmod(0o755)
+        installs.append(script)
+
+    monkeypatch.setenv("CONDA_EXE", str(installs[0]))
+    assert environment.find_conda_executable() == installs[0].resolve()
+    monkeypatch.setenv("CONDA_EXE", str(installs[1]))
+    assert environment.find_conda_executable() == installs[1].resolve()
+
+
+def test_find_conda_executable_finds_conda_installed_in_search_path_after_a_miss(
+    tmp_path, isolated_conda_env, monkeypatch
+) -> None:
+    search_dir = tmp_path / "search"
+    search_dir.mkdir()
+    monkeypatch.setattr(environment, "load_conda_search_paths", lambda: [str(search_dir)])
+
+    assert environment.find_conda_executable() is None
+
+    executable_name = "conda.exe" if sys.platform == "win32" else "conda"
+    installed = search_dir / "condabin" / executable_name
+    installed.parent.mkdir()
+    installed.write_text("#!/bin/sh\necho 'conda 24.1'\n")
+    installed.chmod(0o755)
+
+    assert environment.find_conda_executable() == installed.resolve()
+
+
+def test_find_conda_executable_searches_path_entries(
+    tmp_path, isolated_conda_env, monkeypatch
+) -> None:
+    executable_name = "conda.exe" if sys.platform == "win32" else "conda"
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    installed = bin_dir / executable_name
+    installed.write_text("#!/bin/sh\necho 'conda 24.1'\n")
+    installed.chmod(0o755)
+
+    monkeypatch.setenv("PATH", os.pathsep.join([str(tmp_path / "missing"), "", str(bin_dir)]))
+
+    assert environment.find_conda_executable() == installed.resolve()
+    assert environment._path_entries() == (str(tmp_path / "missing"), str(bin_dir))
+
+
+def test_collect_targets_rescans_when_cached_env_changed(
+    tmp_path, monkeypatch, isolated_settings
+) -> None:
+    env_dir = tmp_path / "envs" / "delta"
+    env_python = env_dir / "python"
+    (env_dir / "conda-meta").mkdir(parents=True)
+    env_python.write_text("#!/bin/sh\n")
+    resolved = str(env_python.resolve())
+    config.save_cached_conda_envs([("delta", resolved)], {resolved: environment.conda_meta_mtime(env_python)})
+    assert config.load_cached_conda_env_mtimes() == {resolved: environment.conda_meta_mtime(env_python)}
+
+    lookups: list[object] = []
+
+    def fake_find(candidate=None):
+        lookups.append(candidate)
+        return None
+
+    monkeypatch.setattr(cli, "find_conda_executable", fake_find)
+
+    targets = cli._collect_targets(include_conda=True, conda_candidate=None, explicit_pythons=None)
+    assert ("delta", env_python) in targets
+    assert lookups == []
+
+    (env_dir / "conda-meta" / "rich-13.7.0-py_0.json").write_text("{}")
+    targets = cli._collect_targets(include_conda=True, conda_candidate=None, explicit_pythons=None)
+    assert ("delta", env_python) in targets
+    assert lookups == [None]
+
+
+def test_cached_conda_envs_expire_after_ttl(monkeypatch, isolated_settings) -> None:
+    config.save_cached_conda_envs([("alpha", "/envs/alpha/python")])
+    assert config.load_cached_conda_envs() == [("alpha", "/envs/alpha/python")]
+
+    isolated_settings.write_text(
+        '[conda]\ncached_envs = {"_v": 1, "saved_at": 1000, "envs": [{"name": "alpha", "path": "/envs/alpha/python"}]}\n',
+        encoding="utf-8",
+    )
+    assert config.load_cached_conda_envs() == []
+
+    assert config.lookup_cached_conda_env("alpha") is None
+    assert list(config.iter_cached_conda_env_names()) == []
+
+    monkeypatch.setenv(config.CACHE_TTL_ENV_VAR, str(10 ** 12))
+    assert config.load_cached_conda_envs() == [("alpha", "/envs/alpha/python")]
+    assert config.lookup_cached_conda_env("alpha") == "/envs/alpha/python"
+    assert list(config.iter_cached_conda_env_names()) == ["alpha"]
+
+
+def test_register_after_expiry_keeps_entries(isolated_settings) -> None:
+    config.save_cached_conda_envs([("alpha", "/envs/alpha/python")], saved_at=1000)
+    assert config.cached_conda_envs_expired()
+
+    config.add_cached_conda_env("gamma", "/manual/gamma/python")
+
+    assert not config.cached_conda_envs_expired()
+    assert config.load_cached_conda_envs() == [
+        ("alpha", "/envs/alpha/python"),
+        ("gamma", "/manual/gamma/python"),
+    ]
+
+
+def test_rescan_after_expiry_keeps_registered_envs(
+    tmp_path, monkeypatch, isolated_settings, fake_conda_tree
+) -> None:
+    manual_python = tmp_path / "manual" / "gamma" / "python"
+    manual_python.parent.mkdir(parents=True)
+    manual_python.write_text("#!/bin/sh\n")
+    config.save_cached_conda_envs([("gamma", str(manual_python.resolve()))], saved_at=1000)
+
+    monkeypatch.setattr(cli, "find_conda_executable", lambda candidate=None: fake_conda_tree.conda)
+    monkeypatch.setattr(cli, "list_conda_environments", lambda _conda: fake_conda_tree.envs)
+    monkeypatch.setattr(cli, "resolve_python_executable", lambda env: fake_conda_tree.python_paths.get(env))
+
+    targets = cli._collect_targets(include_conda=True, conda_candidate=None, explicit_pythons=None)
+
+    assert {"gamma", "alpha", "beta"} <= {name for name, _ in targets}
+    assert {name for name, _ in config.load_cached_conda_envs()} == {"gamma", "alpha", "beta"}
+    assert not config.cached_conda_envs_expired()
+
+
+def test_warm_cache_runs_do_not_extend_ttl(tmp_path, monkeypatch, isolated_settings) -> None:
+    env_python = tmp_path / "envs" / "delta" / "python"
+    env_python.parent.mkdir(parents=True)
+    env_python.write_text("#!/bin/sh\n")
+    saved_at = int(time.time()) - 3590
+    config.save_cached_conda_envs([("delta", str(env_python.resolve()))], saved_at=saved_at)
+
+    lookups: list[object] = []
+
+    def fake_find(candidate=None):
+        lookups.append(candidate)
+        return None
+
+    monkeypatch.setattr(cli, "find_conda_executable", fake_find)
+    monkeypatch.setenv(config.CACHE_TTL_ENV_VAR, "3600")
+
+    cli._collect_targets(include_conda=True, conda_candidate=None, explicit_pythons=None)
+    assert lookups == []
+    assert config.load_cached_conda_envs_saved_at() == saved_at
+
+    # Stand in for the clock moving past the TTL boundary.
+    monkeypatch.setenv(config.CACHE_TTL_ENV_VAR, "3500")
+    cli._collect_targets(include_conda=True, conda_candidate=None, explicit_pythons=None)
+    assert lookups == [None]
+
+
+def test_inspect_targets_keeps_target_order(monkeypatch) -> None:
+    delays = {"slow": 0.05, "medium": 0.02, "fast": 0.0}
+
+    def fake_inspect(name, path, requirements):
+        time.sleep(delays[name])
+        return EnvironmentReport(
+            name=name,
+            python_executable=path,
+            python_version="3.10",
+            compatibility=100.0,
+            matching=[],
+            missing=[],
+            mismatched=[],
+            total_requirements=0,
+        )
+
+    monkeypatch.setattr(cli, "inspect_environment", fake_inspect)
+    targets = [(name, Path(f"/envs/{name}/python")) for name in delays]
+
+    reports = cli._inspect_targets(targets, [], max_workers=3)
+
+    assert [report.name for report in reports] == ["slow", "medium", "fast"]
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="symlinks need extra privileges on Windows")
+def test_list_conda_environments_filters_and_resolves_prefixes(tmp_path, monkeypatch) -> None:
+    real_env = tmp_path / "envs" / "real"
+    real_env.mkdir(parents=True)
+    linked_env = tmp_path / "linked"
+    linked_env.symlink_to(real_env)
+    stray_file = tmp_path / "not-an-env"
+    stray_file.write_text("")
+    payload = {"envs": [str(real_env), str(linked_env), str(stray_file), str(tmp_path / "missing"), 3]}
+
+    def fake_run(command, **kwargs):
+        return subprocess.CompletedProcess(command, 0, stdout=json.dumps(payload).encode(), stderr=b"")
+
+    monkeypatch.setattr(subprocess, "run", fake_run)
+
+    assert environment.list_conda_environments(tmp_path / "conda") == [real_env]
+
+
+def test_find_conda_executable_conda_exe_skips_search_locations(
+    tmp_path, isolated_conda_env, monkeypatch
+) -> None:
+    executable_name = "conda.exe" if sys.platform == "win32" else "conda"
+    activated = tmp_path / "activated" / "bin" / executable_name
+    activated.parent.mkdir(parents=True)
+    activated.write_text("#!/bin/sh\necho 'conda 24.1'\n")
+    activated.chmod(0o755)
+
+    def unexpected(*args, **kwargs):
+        raise AssertionError("search locations should not be expanded")
+
+    monkeypatch.setattr(environment, "load_conda_search_paths", lambda: [str(tmp_path / "elsewhere")])
+    monkeypatch.setattr(environment, "_expand_conda_from_directory", unexpected)
+    monkeypatch.setattr(environment, "_conda_on_path", unexpected)
+    monkeypatch.setenv("CONDA_EXE", str(activated))
+
+    assert environment.find_conda_executable() == activated.resolve()
+
+
+def test_progress_level_reports_every_tenth_at_info() -> None:
+    levels = [cli._progress_level(index, 100) for index in range(1, 101)]
+
+    assert levels.count(logging.INFO) == 10
+    assert cli._progress_level(100, 100) == logging.INFO
+    assert cli._progress_level(1, 2) == logging.INFO
+
+
+def test_find_conda_executable_finds_conda_installed_after_a_miss(
+    tmp_path, isolated_conda_env, monkeypatch
+) -> None:
+    executable_name = "conda.exe" if sys.platform == "win32" else "conda"
+    conda_exe = tmp_path / "later" / "bin" / executable_name
+    conda_exe.parent.mkdir(parents=True)
+    monkeypatch.setenv("CONDA_EXE", str(conda_exe))
+
+    assert environment.find_conda_executable() is None
+
+    conda_exe.write_text("#!/bin/sh\necho 'conda 24.1'\n")
+    conda_exe.chmod(0o755)
+
+    assert environment.find_conda_executable() == conda_exe.resolve()
+
+
+def test_configure_logging_accepts_logging_level_aliases() -> None:
+    root = logging.getLogger()
+    previous = root.level
+    try:
+        cli._configure_logging("notset")
+        assert root.level == logging.NOTSET
+        cli._configure_logging("FATAL")
+        assert root.level == logging.CRITICAL
+    finally:
+        root.setLevel(previous)
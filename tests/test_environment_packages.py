@@ -0,0 +1,229 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from psypyenv import _jsonlib, environment
+from psypyenv.models import EnvironmentReport
+from psypyenv.reporting import reports_to_json
+
+
+def _make_env(root: Path) -> Path:
+    if sys.platform == "win32":
+        python_path = root / "python.exe"
+        site_packages = root / "Lib" / "site-packages"
+    else:
+        python_path = root / "bin" / "python3.11"
+        site_packages = root / "lib" / "python3.11" / "site-packages"
+    python_path.parent.mkdir(parents=True, exist_ok=True)
+    python_path.write_text("")
+    site_packages.mkdir(parents=True)
+    (root / "pyvenv.cfg").write_text("home = /usr/bin\ninclude-system-site-packages = false\n")
+
+    dist_info = site_packages / "Requests-2.31.0.dist-info"
+    dist_info.mkdir()
+    (dist_info / "METADATA").write_text(
+        "Metadata-Version: 2.1\nName: Requests\nVersion: 2.31.0\nSummary: HTTP\n"
+    )
+    egg_info = site_packages / "legacy_pkg.egg-info"
+    egg_info.mkdir()
+    (egg_info / "PKG-INFO").write_text("Metadata-Version: 1.0\nName: legacy_pkg\nVersion: 0.3\n")
+    (site_packages / "single-1.0.egg-info").write_text("Name: single\nVersion: 1.0\n")
+    (site_packages / "requests").mkdir()
+    return python_path
+
+
+def test_get_installed_packages_reads_site_packages(tmp_path, monkeypatch) -> None:
+    python_path = _make_env(tmp_path / "env")
+
+    def fail_run(*args, **kwargs):
+        raise AssertionError("pip should not be spawned when metadata is on disk")
+
+    monkeypatch.setattr(subprocess, "run", fail_run)
+
+    packages = environment.get_installed_packages(python_path)
+
+    assert packages == {"requests": "2.31.0", "legacy-pkg": "0.3", "single": "1.0"}
+
+
+def test_get_installed_packages_falls_back_to_pip(tmp_path, monkeypatch) -> None:
+    python_path = tmp_path / "bin" / "python"
+    python_path.parent.mkdir()
+    python_path.write_text("")
+    calls: list[list[str]] = []
+
+    def fake_run(command, **kwargs):
+        calls.append(command)
+        return subprocess.CompletedProcess(command, 0, stdout='[{"name": "Demo_Pkg", "version": "1.2"}]', stderr="")
+
+    monkeypatch.setattr(subprocess, "run", fake_run)
+
+    packages = environment.get_installed_packages(python_path)
+
+    assert packages == {"demo-pkg": "1.2"}
+    assert calls and calls[0][1:4] == ["-m", "pip", "list"]
+
+
+def test_get_installed_packages_asks_pip_when_prefix_is_not_isolated(tmp_path, monkeypatch) -> None:
+    python_path = _make_env(tmp_path / "env")
+    pyvenv = tmp_path / "env" / "pyvenv.cfg"
+
+    def fake_run(command, **kwargs):
+        stdout = '[{"name": "requests", "version": "2.31.0"}, {"name": "demo-user-pkg", "version": "0.1"}]'
+        return subprocess.CompletedProcess(command, 0, stdout=stdout, stderr="")
+
+    monkeypatch.setattr(subprocess, "run", fake_run)
+
+    # A plain prefix still sees user site-packages (pip install --user).
+    pyvenv.unlink()
+    assert environment.get_installed_packages(python_path)["demo-user-pkg"] == "0.1"
+
+    pyvenv.write_text("home = /usr/bin\ninclude-system-site-packages = true\n")
+    assert environment.get_installed_packages(python_path)["demo-user-pkg"] == "0.1"
+
+
+def test_get_python_version_reads_environment_files(tmp_path, monkeypatch) -> None:
+    def fail_run(*args, **kwargs):
+        raise AssertionError("the interpreter should not be spawned")
+
+    monkeypatch.setattr(subprocess, "run", fail_run)
+
+    venv = tmp_path / "venv"
+    (venv / "bin").mkdir(parents=True)
+    (venv / "pyvenv.cfg").write_text("home = /usr/bin\nversion = 3.10.12\n")
+    assert environment.get_python_version(venv / "bin" / "python") == "3.10.12"
+
+    conda_env = tmp_path / "conda"
+    (conda_env / "bin").mkdir(parents=True)
+    (conda_env / "conda-meta").mkdir()
+    (conda_env / "conda-meta" / "python-dateutil-2.8.2-pyhd3eb1b0_0.json").write_text('{"version": "2.8.2"}')
+    (conda_env / "conda-meta" / "python-3.9.18-h955ad1f_0.json").write_text('{"name": "python", "version": "3.9.18"}')
+    assert environment.get_python_version(conda_env / "bin" / "python") == "3.9.18"
+
+
+def test_get_installed_packages_merges_conda_meta(tmp_path) -> None:
+    python_path = _make_env(tmp_path / "env")
+    conda_meta = tmp_path / "env" / "conda-meta"
+    conda_meta.mkdir()
+    (conda_meta / "requests-2.30.0-py311h06a4308_0.json").write_text("{}")
+    (conda_meta / "libffi-3.4.4-h6a678d5_0.json").write_text("{}")
+    (conda_meta / "pytorch-2.1.0-py3.11_cpu_0.json").write_text("{}")
+    (conda_meta / "history").write_text("")
+
+    packages = environment.get_installed_packages(python_path)
+
+    assert packages["requests"] == "2.31.0"
+    assert packages["libffi"] == "3.4.4"
+    assert packages["torch"] == "2.1.0"
+
+
+def test_get_installed_packages_does_not_retry_missing_interpreter(tmp_path, monkeypatch) -> None:
+    calls: list[list[str]] = []
+
+    def missing_run(command, **kwargs):
+        calls.append(command)
+        raise FileNotFoundError(command[0])
+
+    monkeypatch.setattr(subprocess, "run", missing_run)
+
+    packages = environment.get_installed_packages(tmp_path / "bin" / "python")
+
+    assert packages == {}
+    assert len(calls) == 1
+
+
+def test_get_installed_packages_uses_dist_info_directory_names(tmp_path) -> None:
+    python_path = _make_env(tmp_path / "env")
+    site_packages = next(path for path in (tmp_path / "env").rglob("site-packages"))
+    (site_packages / "zope_interface-6.1.dist-info").mkdir()
+    odd = site_packages / "oddly_named.dist-info"
+    odd.mkdir()
+    (odd / "METADATA").write_text("Name: Oddly.Named\nVersion: 0.9\n")
+
+    packages = environment.get_installed_packages(python_path)
+
+    assert packages["zope-interface"] == "6.1"
+    assert packages["oddly-named"] == "0.9"
+    assert environment.normalise_name("Zope.Interface") == "zope-interface"
+
+
+def test_get_installed_packages_cached_until_site_packages_changes(tmp_path, monkeypatch, _isolated_cache_dir) -> None:
+    python_path = _make_env(tmp_path / "env")
+    scans: list[Path] = []
+    original_scan = environment._scan_site_packages
+
+    def counting_scan(path):
+        scans.append(path)
+        return original_scan(path)
+
+    monkeypatch.setattr(environment, "_scan_site_packages", counting_scan)
+
+    first = environment.get_installed_packages(python_path)
+    assert environment.get_installed_packages(python_path) == first
+    assert len(scans) == 1
+
+    site_packages = next(path for path in (tmp_path / "env").rglob("site-packages"))
+    (site_packages / "rich-13.7.0.dist-info").mkdir()
+    refreshed = environment.get_installed_packages(python_path)
+    assert refreshed["rich"] == "13.7.0"
+    assert len(scans) == 2
+    assert len(list((_isolated_cache_dir / "packages").iterdir())) == 1
+
+
+def test_get_installed_packages_parses_pip_freeze_fallback(tmp_path, monkeypatch) -> None:
+    python_path = tmp_path / "bin" / "python"
+    python_path.parent.mkdir()
+    python_path.write_text("")
+
+    def fake_run(command, **kwargs):
+        if "list" in command:
+            raise subprocess.CalledProcessError(1, command)
+        stdout = "Demo_Pkg==1.2\n-e git+https://example.com/repo.git#egg=editable\nlocal @ file:///tmp/local\nother == 3.0\n"
+        return subprocess.CompletedProcess(command, 0, stdout=stdout, stderr="")
+
+    monkeypatch.setattr(subprocess, "run", fake_run)
+
+    assert environment.get_installed_packages(python_path) == {"demo-pkg": "1.2", "other": "3.0"}
+
+
+def test_get_python_version_uses_conda_record_file_name(tmp_path, monkeypatch) -> None:
+    def fail_run(*args, **kwargs):
+        raise AssertionError("the interpreter should not be spawned")
+
+    monkeypatch.setattr(subprocess, "run", fail_run)
+
+    conda_env = tmp_path / "conda"
+    (conda_env / "bin").mkdir(parents=True)
+    (conda_env / "conda-meta").mkdir()
+    (conda_env / "conda-meta" / "python-3.11.4-h955ad1f_0.json").write_text("not json")
+
+    assert environment.get_python_version(conda_env / "bin" / "python") == "3.11.4"
+
+
+def test_json_output_does_not_depend_on_orjson(monkeypatch) -> None:
+    report = EnvironmentReport(
+        name="café",
+        python_executable=Path("/envs/café/bin/python"),
+        python_version="3.11",
+        compatibility=50.0,
+        matching=["naïve-pkg"],
+        missing=["日本語"],
+        mismatched=[],
+        total_requirements=2,
+    )
+    payload = {"envs": [{"name": "café", "path": "/envs/café/bin/python"}]}
+
+    orjson = _jsonlib.orjson
+    monkeypatch.setattr(_jsonlib, "orjson", None)
+    stdlib_report = reports_to_json([report])
+    stdlib_compact = _jsonlib.dumps(payload)
+    assert "naïve-pkg" in stdlib_report and "日本語" in stdlib_report
+
+    if orjson is None:
+        pytest.skip("orjson is not installed")
+    monkeypatch.setattr(_jsonlib, "orjson", orjson)
+    assert reports_to_json([report]) == stdlib_report
+    assert _jsonlib.dumps(payload) == stdlib_compact
@@ -57,3 +57,56 @@ def test_sample_directory_contains_ten_files() -> None:
     sample_files = list(DATA_DIR.glob("*.txt"))
     assert len(sample_files) == 10
     assert all(file.is_file() for file in sample_files)
+
+
+def test_parse_requirements_reuses_cache_until_file_changes(tmp_path: Path, monkeypatch) -> None:
+    from psypyenv import requirements
+
+    parsed_paths = []
+    original = requirements._parse_requirements_file
+
+    def counting_parse(path):
+        parsed_paths.append(path)
+        return original(path)
+
+    monkeypatch.setattr(requirements, "_parse_requirements_file", counting_parse)
+    requirements_file = tmp_path / "requirements.txt"
+    requirements_file.write_text("numpy>=1.20\n", encoding="utf-8")
+
+    first, _ = parse_requirements(requirements_file)
+    second, _ = parse_requirements(requirements_file)
+    assert [req.name for req in second] == [req.name for req in first] == ["numpy"]
+    assert len(parsed_paths) == 1
+
+    requirements_file.write_text("numpy>=1.20\npandas\n", encoding="utf-8")
+    third, _ = parse_requirements(requirements_file)
+    assert [req.name for req in third] == ["numpy", "pandas"]
+    assert len(parsed_paths) == 2
+
+
+def test_parse_requirements_repeat_calls_skip_disk_cache(tmp_path: Path, monkeypatch, caplog) -> None:
+    from psypyenv import requirements
+
+    requirements_file = tmp_path / "requirements.txt"
+    requirements_file.write_text("numpy>=1.20\nnot a valid ==\n", encoding="utf-8")
+    first, _ = parse_requirements(requirements_file)
+
+    def unexpected_load(namespace, key):
+        raise AssertionError("the in-process cache should answer repeat calls")
+
+    monkeypatch.setattr(requirements, "load_cached_object", unexpected_load)
+    caplog.clear()
+    second, _ = parse_requirements(requirements_file)
+    assert any("Invalid requirement at line 2" in message for message in caplog.messages)
+    second.clear()
+    assert [req.name for req in parse_requirements(requirements_file)[0]] == [req.name for req in first]
+
+
+def test_parse_requirements_keeps_one_cache_entry_per_file(tmp_path: Path, _isolated_cache_dir: Path) -> None:
+    requirements_file = tmp_path / "requirements.txt"
+    for content in ("numpy\n", "numpy\npandas\n", "numpy>=1.20\n"):
+        requirements_file.write_text(content, encoding="utf-8")
+        parse_requirements(requirements_file)
+
+    assert len(list((_isolated_cache_dir / "requirements").iterdir())) == 1
+    assert [req.name for req in parse_requirements(requirements_file)[0]] == ["numpy"]